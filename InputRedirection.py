@@ -12,6 +12,8 @@ from enum import IntEnum
 import time
 import math
 
+from utils import precise_sleep
+
 TOUCH_SCREEN_WIDTH = 320
 TOUCH_SCREEN_HEIGHT = 240
 HID_AXIS_MAX = 0xFFF
@@ -19,34 +21,19 @@ CPAD_BOUND = 0x5D0
 CPP_BOUND = 0x7F
 SQRT_1_2 = math.sqrt(0.5)
 
-def precise_sleep(duration_sec):
-    """
-    High-precision sleep using busy-wait for sub-2ms durations.
+# Idle (nothing pressed / centered) field encodings
+HID_PAD_IDLE = 0xFFF
+TOUCH_SCREEN_IDLE = 0x2000000
+CIRCLE_PAD_IDLE = 0x7FF7FF
+CPP_STATE_IDLE = 0x80800081
 
-    time.sleep() has ~15ms granularity on Windows, which is too coarse
-    for frame-accurate input timing. This hybrid approach uses sleep()
-    for longer waits (to save CPU) and busy-waits the final ~2ms.
-    """
-    if duration_sec <= 0:
-        return
-    if duration_sec < 0.002:
-        end = time.perf_counter() + duration_sec
-        while time.perf_counter() < end:
-            pass
-        return
-    sleep_until = time.perf_counter() + duration_sec - 0.002
-    while time.perf_counter() < sleep_until:
-        remaining = sleep_until - time.perf_counter()
-        if remaining > 0.005:
-            time.sleep(min(remaining * 0.5, 0.001))
-        else:
-            break
-    end = time.perf_counter() + duration_sec - (time.perf_counter() - (sleep_until - duration_sec + 0.002))
-    while time.perf_counter() < end:
-        pass
+# hid_pad, touch_screen, circle_pad, cpp_state, interface_buttons
+_PACKET_STRUCT = struct.Struct("<IIIII")
 
 def clamp(v: float, lo: float, hi: float) -> float:
-    return max(lo, min(hi, v))
+    # Same result as max(lo, min(hi, v)) (NaN -> hi) without the builtin calls
+    v = v if v < hi else hi
+    return v if v > lo else lo
 
 class InputRedirectionButton(IntEnum):
     A = 0
@@ -71,6 +58,11 @@ class InputRedirectionInterfaceButton(IntEnum):
     POWER = 1
     POWER_LONG = 2
 
+# Precomputed bit for each button
+_HID_BIT = {b: 1 << int(b) for b in InputRedirectionButton}
+_IR_BIT = {b: 1 << int(b) for b in InputRedirectionIrButton}
+_IFACE_BIT = {b: 1 << int(b) for b in InputRedirectionInterfaceButton}
+
 @dataclass
 class TouchState:
     pressed: bool = False
@@ -89,6 +81,8 @@ class InputRedirectionClient:
 
     _sock: socket.socket = field(init=False, repr=False)
     _addr: tuple = field(init=False, repr=False)
+    _packet: bytearray = field(init=False, repr=False)
+    _connected: bool = field(init=False, repr=False)
 
     _buttons: set[InputRedirectionButton] = field(default_factory=set, repr=False)
     _ir_buttons: set[InputRedirectionIrButton] = field(default_factory=set, repr=False)
@@ -101,6 +95,13 @@ class InputRedirectionClient:
         self._addr = (self.ip, self.port)
         self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self._sock.setblocking(False)
+        self._packet = bytearray(_PACKET_STRUCT.size)
+        # A connected UDP socket skips per-packet address handling in send()
+        try:
+            self._sock.connect(self._addr)
+            self._connected = True
+        except OSError:
+            self._connected = False
 
     def set_buttons_held(
         self,
@@ -136,8 +137,10 @@ class InputRedirectionClient:
 
     def press_touch(self, x_px: int, y_px: int) -> None:
         self._touch.pressed = True
-        self._touch.x = max(0, min(TOUCH_SCREEN_WIDTH - 1, int(x_px)))
-        self._touch.y = max(0, min(TOUCH_SCREEN_HEIGHT - 1, int(y_px)))
+        x = int(x_px)
+        y = int(y_px)
+        self._touch.x = 0 if x < 0 else (TOUCH_SCREEN_WIDTH - 1 if x >= TOUCH_SCREEN_WIDTH else x)
+        self._touch.y = 0 if y < 0 else (TOUCH_SCREEN_HEIGHT - 1 if y >= TOUCH_SCREEN_HEIGHT else y)
 
     def reset_touch(self) -> None:
         self._touch.pressed = False
@@ -153,16 +156,14 @@ class InputRedirectionClient:
         self.reset_touch()
 
     def _encode_hid_pad(self) -> int:
-        hid_pad = 0xFFF
         mask = 0
         for b in self._buttons:
-            mask |= (1 << int(b))
-        hid_pad &= ~mask
-        return hid_pad
+            mask |= _HID_BIT[b]
+        return HID_PAD_IDLE & ~mask
 
     def _encode_touch_screen(self) -> int:
         if not self._touch.pressed:
-            return 0x2000000
+            return TOUCH_SCREEN_IDLE
 
         x = (HID_AXIS_MAX * self._touch.x) // TOUCH_SCREEN_WIDTH
         y = (HID_AXIS_MAX * self._touch.y) // TOUCH_SCREEN_HEIGHT
@@ -170,7 +171,7 @@ class InputRedirectionClient:
 
     def _encode_circle_pad(self) -> int:
         if self._circle_pad.x == 0.0 and self._circle_pad.y == 0.0:
-            return 0x7FF7FF
+            return CIRCLE_PAD_IDLE
 
         x = int(self._circle_pad.x * CPAD_BOUND + 0x800)
         y = int(self._circle_pad.y * CPAD_BOUND + 0x800)
@@ -180,17 +181,19 @@ class InputRedirectionClient:
         if y >= 0xFFF:
             y = 0x000 if self._circle_pad.y < 0 else 0xFFF
 
-        x = max(0, x)
-        y = max(0, y)
+        if x < 0:
+            x = 0
+        if y < 0:
+            y = 0
         return (y << 12) | x
 
     def _encode_cpp_state(self) -> int:
         ir_mask = 0
         for b in self._ir_buttons:
-            ir_mask |= (1 << int(b))
+            ir_mask |= _IR_BIT[b]
 
         if self._c_stick.x == 0.0 and self._c_stick.y == 0.0 and ir_mask == 0:
-            return 0x80800081
+            return CPP_STATE_IDLE
 
         rx = self._c_stick.x
         ry = self._c_stick.y
@@ -205,29 +208,54 @@ class InputRedirectionClient:
         if y >= 0xFF:
             y = 0x00 if rotated_y < 0 else 0xFF
 
-        x = max(0, min(0xFF, x))
-        y = max(0, min(0xFF, y))
+        x = 0 if x < 0 else (0xFF if x > 0xFF else x)
+        y = 0 if y < 0 else (0xFF if y > 0xFF else y)
 
         return (y << 24) | (x << 16) | (ir_mask << 8) | 0x81
 
     def _encode_interface_buttons(self) -> int:
         mask = 0
         for b in self._interface_buttons:
-            mask |= (1 << int(b))
+            mask |= _IFACE_BIT[b]
         return mask
 
-    def _build_packet(self) -> bytes:
-        hid_pad = self._encode_hid_pad()
-        touch_screen = self._encode_touch_screen()
-        circle_pad = self._encode_circle_pad()
-        cpp_state = self._encode_cpp_state()
-        interface_buttons = self._encode_interface_buttons()
-
-        return struct.pack("<IIIII", hid_pad, touch_screen, circle_pad, cpp_state, interface_buttons)
+    def _build_packet(self) -> bytearray:
+        """Encode the current state into the reusable packet buffer."""
+        _PACKET_STRUCT.pack_into(
+            self._packet,
+            0,
+            self._encode_hid_pad(),
+            self._encode_touch_screen(),
+            self._encode_circle_pad(),
+            self._encode_cpp_state(),
+            self._encode_interface_buttons(),
+        )
+        return self._packet
 
     def send_update(self) -> None:
         packet = self._build_packet()
-        self._sock.sendto(packet, self._addr)
+        if not self._connected:
+            self._sock.sendto(packet, self._addr)
+            return
+        try:
+            self._sock.send(packet)
+        except ConnectionError:
+            # ICMP port unreachable from an earlier packet (3DS side not listening
+            # yet): ConnectionRefusedError on POSIX, ConnectionResetError
+            # (WSAECONNRESET) on Windows. Unconnected sendto never reported this,
+            # so ignore it as well.
+            pass
+
+
+# App-level button names -> 3DS HID buttons
+_BACKEND_BUTTON_MAP = {
+    "A": InputRedirectionButton.A, "B": InputRedirectionButton.B,
+    "X": InputRedirectionButton.X, "Y": InputRedirectionButton.Y,
+    "Up": InputRedirectionButton.UP, "Down": InputRedirectionButton.DOWN,
+    "Left": InputRedirectionButton.LEFT, "Right": InputRedirectionButton.RIGHT,
+    "L": InputRedirectionButton.L, "R": InputRedirectionButton.R,
+    "Start": InputRedirectionButton.START, "Select": InputRedirectionButton.SELECT,
+}
 
 
 class InputRedirectionBackend:
@@ -240,7 +268,7 @@ class InputRedirectionBackend:
         self.client = InputRedirectionClient(ip=ip, port=port)
         self._connected = True  # UDP is stateless; treat as enabled
 
-        self._pressed: set[InputRedirectionButton] = set()
+        self._pressed: frozenset[InputRedirectionButton] = frozenset()
         self._pressed_iface: set[InputRedirectionInterfaceButton] = set()
         self._pressed_ir: set[InputRedirectionIrButton] = set()
 
@@ -262,19 +290,12 @@ class InputRedirectionBackend:
     def set_buttons(self, buttons: list[str]):
         """
         buttons are app-level names, e.g. ["A","Up","L"] etc.
+        Repeating the currently held set is a no-op (nothing is sent).
         """
-        mapping = {
-            "A": InputRedirectionButton.A, "B": InputRedirectionButton.B,
-            "X": InputRedirectionButton.X, "Y": InputRedirectionButton.Y,
-            "Up": InputRedirectionButton.UP, "Down": InputRedirectionButton.DOWN,
-            "Left": InputRedirectionButton.LEFT, "Right": InputRedirectionButton.RIGHT,
-            "L": InputRedirectionButton.L, "R": InputRedirectionButton.R,
-            "Start": InputRedirectionButton.START, "Select": InputRedirectionButton.SELECT,
-        }
-        pressed = set()
-        for b in buttons:
-            if b in mapping:
-                pressed.add(mapping[b])
+        mapping = _BACKEND_BUTTON_MAP
+        pressed = frozenset(mapping[b] for b in buttons if b in mapping)
+        if pressed == self._pressed:
+            return
 
         self._pressed = pressed
         self.client.set_buttons_held(self._pressed, self._pressed_iface, self._pressed_ir)
@@ -353,7 +374,7 @@ class InputRedirectionBackend:
             precise_sleep(float(settle))
 
     def reset_neutral(self):
-        self._pressed.clear()
+        self._pressed = frozenset()
         self._pressed_iface.clear()
         self._pressed_ir.clear()
         self.client.reset_neutral()
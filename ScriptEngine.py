@@ -24,7 +24,10 @@ import urllib.request
 import urllib.error
 import uuid
 from tkinter import messagebox, simpledialog
-from utils import exe_dir_path, python_path, is_python_available, ffplay_path, find_sound_file, list_sound_files
+from utils import (
+    exe_dir_path, python_path, is_python_available, ffplay_path, find_sound_file, list_sound_files,
+    bgr_frame_to_image, mean_bgr_int, precise_sleep, precise_sleep_interruptible,
+)
 
 # Optional OCR support via pytesseract
 try:
@@ -182,81 +185,6 @@ def get_page_width(page):
     """Returns the column width for a given name page."""
     return 7 if page is NAME_PAGE_OTHER else 9
 
-# ----------------------------
-# High-Precision Timing Utilities
-# ----------------------------
-
-def precise_sleep(duration_sec):
-    """
-    High-precision sleep using a hybrid approach:
-    - Use time.sleep() for most of the duration
-    - Busy-wait for the final ~2ms for precision
-
-    This minimizes CPU usage while maintaining sub-millisecond precision.
-    """
-    if duration_sec <= 0:
-        return
-
-    # For very short durations (< 2ms), use pure busy-wait
-    if duration_sec < 0.002:
-        end = time.perf_counter() + duration_sec
-        while time.perf_counter() < end:
-            pass  # Busy-wait for precision
-        return
-
-    # For longer durations, sleep most of the time, then busy-wait
-    # Sleep until 2ms before target to avoid oversleeping
-    sleep_until = time.perf_counter() + duration_sec - 0.002
-
-    # Sleep in small chunks, checking periodically
-    while time.perf_counter() < sleep_until:
-        remaining = sleep_until - time.perf_counter()
-        if remaining > 0.005:  # If more than 5ms remaining, sleep
-            time.sleep(min(remaining * 0.5, 0.001))  # Sleep conservatively
-        else:
-            break
-
-    # Busy-wait for the final ~2ms for precision
-    end = time.perf_counter() + duration_sec - (time.perf_counter() - (sleep_until - duration_sec + 0.002))
-    while time.perf_counter() < end:
-        pass
-
-def precise_sleep_interruptible(duration_sec, stop_event):
-    """
-    High-precision interruptible sleep that checks stop_event.
-    Returns True if interrupted, False if completed.
-    """
-    if duration_sec <= 0:
-        return False
-
-    end_time = time.perf_counter() + duration_sec
-
-    # For very short durations, just busy-wait with stop checks
-    if duration_sec < 0.002:
-        while time.perf_counter() < end_time:
-            if stop_event.is_set():
-                return True
-        return False
-
-    # For longer durations, check stop event periodically
-    while time.perf_counter() < end_time:
-        if stop_event.is_set():
-            return True
-
-        remaining = end_time - time.perf_counter()
-        if remaining <= 0:
-            break
-
-        # Sleep or busy-wait depending on remaining time
-        if remaining > 0.002:
-            # Sleep in small chunks for most of the duration
-            time.sleep(min(remaining * 0.5, 0.001))
-        else:
-            # Busy-wait for final precision
-            pass
-
-    return False
-
 # ----------------------------
 # Script Command Spec
 # ----------------------------
@@ -453,9 +381,7 @@ def frame_to_json_payload(frame_bgr: np.ndarray):
     """
     if frame_bgr is None:
         return None
-    # Convert to RGB for PIL
-    rgb = frame_bgr[:, :, ::-1]
-    img = Image.fromarray(rgb)
+    img = bgr_frame_to_image(frame_bgr)
     buf = io.BytesIO()
     img.save(buf, format="PNG")
     b64 = base64.b64encode(buf.getvalue()).decode("ascii")
@@ -467,8 +393,7 @@ def frame_to_png_bytes(frame_bgr: np.ndarray):
     """
     if frame_bgr is None:
         return None
-    rgb = frame_bgr[:, :, ::-1]
-    img = Image.fromarray(rgb)
+    img = bgr_frame_to_image(frame_bgr)
     buf = io.BytesIO()
     img.save(buf, format="PNG")
     return buf.getvalue()
@@ -705,8 +630,7 @@ def ocr_region(frame_bgr: np.ndarray, x: int, y: int, width: int, height: int,
     region_bgr = frame_bgr[y:y2, x:x2]
 
     # Convert to RGB PIL Image
-    region_rgb = region_bgr[:, :, ::-1]
-    img = Image.fromarray(region_rgb)
+    img = bgr_frame_to_image(region_bgr)
 
     # Preprocess for OCR (returns primary and fallback images)
     img_primary, img_fallback = preprocess_for_ocr(
@@ -1731,11 +1655,7 @@ class ScriptEngine:
                 return
 
             # Compute mean color across all pixels in the region
-            avg_b = float(np.mean(region_bgr[:, :, 0]))
-            avg_g = float(np.mean(region_bgr[:, :, 1]))
-            avg_r = float(np.mean(region_bgr[:, :, 2]))
-
-            avg_rgb = (int(avg_r), int(avg_g), int(avg_b))
+            avg_rgb = mean_bgr_int(region_bgr)
             target = (int(c["rgb"][0]), int(c["rgb"][1]), int(c["rgb"][2]))
             tol = float(c.get("tol", 10))
 
@@ -1830,11 +1750,7 @@ class ScriptEngine:
 
                     if region_bgr.size > 0:
                         # Calculate average color
-                        avg_b = float(np.mean(region_bgr[:, :, 0]))
-                        avg_g = float(np.mean(region_bgr[:, :, 1]))
-                        avg_r = float(np.mean(region_bgr[:, :, 2]))
-
-                        avg_rgb = (int(avg_r), int(avg_g), int(avg_b))
+                        avg_rgb = mean_bgr_int(region_bgr)
 
                         delta_e = delta_e_cie76(avg_rgb, target)
                         matches = delta_e <= tol
@@ -2209,8 +2125,7 @@ class ScriptEngine:
                         break
                     suffix += 1
 
-            rgb = frame[:, :, ::-1]
-            img = Image.fromarray(rgb)
+            img = bgr_frame_to_image(frame)
             img.save(out_path, format="PNG")
 
             outvar = (c.get("out") or "").strip()
@@ -11,6 +11,36 @@ import re
 from tkinter import filedialog, messagebox
 import os
 
+# Source of the subprocess helper that exported run_python_main() executes.
+# Identical for every export, so it is built once and emitted as a literal.
+_RUNNER_SRC = """
+import json, sys, importlib.util, traceback
+
+def load_module_from_path(path):
+    spec = importlib.util.spec_from_file_location('user_module', path)
+    if spec is None or spec.loader is None:
+        raise RuntimeError('Could not load module: ' + path)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+def main():
+    path = sys.argv[1]
+    args = json.loads(sys.argv[2]) if len(sys.argv) > 2 else []
+    mod = load_module_from_path(path)
+    if not hasattr(mod, 'main'):
+        raise RuntimeError('Script does not define main(...)')
+    res = mod.main(*args)
+    print(json.dumps(res, ensure_ascii=False))
+
+if __name__ == '__main__':
+    try:
+        main()
+    except Exception:
+        traceback.print_exc()
+        sys.exit(1)
+"""
+
 def _py_ident(name: str) -> str:
     """
     Convert script var name to a safe Python identifier.
@@ -410,33 +440,7 @@ def export_script_to_python(self):
         exported.append("import subprocess")
         exported.append("")
         exported.append("def run_python_main(script_path, args, timeout_s=10):")
-        exported.append("    runner = r'''")
-        exported.append("import json, sys, importlib.util, traceback")
-        exported.append("")
-        exported.append("def load_module_from_path(path):")
-        exported.append("    spec = importlib.util.spec_from_file_location('user_module', path)")
-        exported.append("    if spec is None or spec.loader is None:")
-        exported.append("        raise RuntimeError('Could not load module: ' + path)")
-        exported.append("    mod = importlib.util.module_from_spec(spec)")
-        exported.append("    spec.loader.exec_module(mod)")
-        exported.append("    return mod")
-        exported.append("")
-        exported.append("def main():")
-        exported.append("    path = sys.argv[1]")
-        exported.append("    args = json.loads(sys.argv[2]) if len(sys.argv) > 2 else []")
-        exported.append("    mod = load_module_from_path(path)")
-        exported.append("    if not hasattr(mod, 'main'):")
-        exported.append("        raise RuntimeError('Script does not define main(...)')")
-        exported.append("    res = mod.main(*args)")
-        exported.append("    print(json.dumps(res, ensure_ascii=False))")
-        exported.append("")
-        exported.append("if __name__ == '__main__':")
-        exported.append("    try:")
-        exported.append("        main()")
-        exported.append("    except Exception:")
-        exported.append("        traceback.print_exc()")
-        exported.append("        sys.exit(1)")
-        exported.append("'''")
+        exported.append(f"    runner = {_RUNNER_SRC!r}")
         exported.append("    cp = subprocess.run([sys.executable, '-c', runner, script_path, json.dumps(args, ensure_ascii=False)],")
         exported.append("                        capture_output=True, text=True, timeout=timeout_s)")
         exported.append("    if cp.returncode != 0:")
@@ -524,10 +528,14 @@ def export_script_to_python(self):
     # -------------------------
     # 6) Write file
     # -------------------------
+    # Single write in text mode (platform newlines, as before); the confirmation
+    # dialog is deferred to idle so the status bar redraws before the modal blocks.
     try:
         with open(out_path, "w", encoding="utf-8") as f:
             f.write("\n".join(exported))
-        self.set_status(f"Exported to Python: {out_path}")
-        messagebox.showinfo("Export", f"Exported Python file:\n{out_path}")
     except Exception as e:
         messagebox.showerror("Export error", str(e))
+        return
+
+    self.set_status(f"Exported to Python: {out_path}")
+    self.root.after_idle(lambda: messagebox.showinfo("Export", f"Exported Python file:\n{out_path}"))
@@ -10,6 +10,8 @@ Supports two protocols:
 The SerialController wrapper auto-detects which protocol a device speaks.
 """
 import os
+import sys
+import select
 import serial
 import time
 import threading
@@ -39,34 +41,91 @@ RIGHT_STICK_BINDINGS = ["Right Stick Up", "Right Stick Down", "Right Stick Left"
 KEYBIND_TARGETS = ALL_BUTTONS + LEFT_STICK_BINDINGS + RIGHT_STICK_BINDINGS
 
 USB_TX_HEADER_BYTES = {0x43, 0x54}
+# Transmit header + neutral high/low bytes.
+_USB_TX_NEUTRAL_PACKET = b"\x54\x00\x00"
+# 256-entry translate table: header bytes map to 0x01, everything else to 0x00.
+_USB_TX_HEADER_TABLE = bytes(1 if i in USB_TX_HEADER_BYTES else 0 for i in range(256))
 PABOTBASE_HINTS = ("pabot", "pokemon", "teensy", "pjrc")
 
+# Per-button 16-bit masks (high << 8 | low) so encoding is one OR per button.
+_BUTTON_MASKS = {b: (m << 8 if w == "high" else m) for b, (w, m) in BUTTON_MAP.items()}
+
+
+# Optional backend methods, probed once per connect by SerialController.
+_CAP_SET_STATE = 1 << 0
+_CAP_SET_LEFT_STICK = 1 << 1
+_CAP_RESET_LEFT_STICK = 1 << 2
+_CAP_SET_RIGHT_STICK = 1 << 3
+_CAP_RESET_RIGHT_STICK = 1 << 4
+_CAP_RESET_NEUTRAL = 1 << 5
+_CAP_PAUSE_KEEPALIVE = 1 << 6
+_CAP_RESUME_KEEPALIVE = 1 << 7
+_CAP_TIMED_PRESS = 1 << 8
+_BACKEND_CAP_METHODS = (
+    (_CAP_SET_STATE, "set_state"),
+    (_CAP_SET_LEFT_STICK, "set_left_stick"),
+    (_CAP_RESET_LEFT_STICK, "reset_left_stick"),
+    (_CAP_SET_RIGHT_STICK, "set_right_stick"),
+    (_CAP_RESET_RIGHT_STICK, "reset_right_stick"),
+    (_CAP_RESET_NEUTRAL, "reset_neutral"),
+    (_CAP_PAUSE_KEEPALIVE, "pause_keepalive"),
+    (_CAP_RESUME_KEEPALIVE, "resume_keepalive"),
+)
+
+
+def _backend_caps(backend):
+    if backend is None:
+        return 0
+    caps = 0
+    for bit, name in _BACKEND_CAP_METHODS:
+        if hasattr(backend, name):
+            caps |= bit
+    if getattr(backend, "supports_timed_press", False):
+        caps |= _CAP_TIMED_PRESS
+    return caps
+
+
 def buttons_to_bytes(buttons):
-    high, low = 0, 0
-    for b in buttons:
-        if b not in BUTTON_MAP:
-            raise ValueError(f"Unknown button: {b}")
-        which, mask = BUTTON_MAP[b]
-        if which == "high":
-            high |= mask
-        else:
-            low |= mask
-    return high & 0xFF, low & 0xFF
+    acc = 0
+    try:
+        for b in buttons:
+            acc |= _BUTTON_MASKS[b]
+    except KeyError as e:
+        raise ValueError(f"Unknown button: {e.args[0]}") from None
+    return (acc >> 8) & 0xFF, acc & 0xFF
+
+
+# Only the low nibble of the high byte carries buttons (L, R, X, Y).
+_HIGH_BUTTON_BITS = 0x0F
+
+
+def _build_byte_to_names(which):
+    return [
+        tuple(name for name in ALL_BUTTONS if BUTTON_MAP[name][0] == which and (value & BUTTON_MAP[name][1]))
+        for value in range(256)
+    ]
+
+
+def _build_state_to_names():
+    high_names = _build_byte_to_names("high")
+    low_names = _build_byte_to_names("low")
+    return tuple(
+        high_names[high] + low_names[low]
+        for high in range(_HIGH_BUTTON_BITS + 1)
+        for low in range(256)
+    )
+
+
+# 12-bit decode table: index with ((high & 0x0F) << 8) | low to get button names.
+_STATE_TO_NAMES = _build_state_to_names()
 
 
 def bytes_to_buttons(high, low):
-    buttons = []
-    for name in ALL_BUTTONS:
-        which, mask = BUTTON_MAP[name]
-        if which == "high" and (high & mask):
-            buttons.append(name)
-        if which == "low" and (low & mask):
-            buttons.append(name)
-    return buttons
+    return list(_STATE_TO_NAMES[((high & _HIGH_BUTTON_BITS) << 8) | (low & 0xFF)])
 
 
 def _contains_usbtx_header(data):
-    return any(b in USB_TX_HEADER_BYTES for b in data)
+    return b"\x01" in data.translate(_USB_TX_HEADER_TABLE)
 
 
 def _build_safe_seqnum_reset():
@@ -81,45 +140,136 @@ def _build_safe_seqnum_reset():
     return None, None
 
 
+def _enable_low_latency(ser):
+    """Ask the driver for its 1ms latency timer (POSIX only; no-op elsewhere)."""
+    try:
+        ser.set_low_latency_mode(True)
+    except (AttributeError, OSError, NotImplementedError, ValueError):
+        pass
+
+
+def _lower_usb_serial_latency_timer(ser, status_cb=None):
+    """
+    Set a Linux usb-serial (FTDI) adapter's latency_timer to 1ms via sysfs.
+
+    The driver default of 16ms otherwise caps how quickly small packets reach
+    the wire. Windows exposes this only through the driver's Advanced port
+    settings, so it is left to the user there (see README).
+    """
+    if not sys.platform.startswith("linux"):
+        return
+    tty = os.path.basename(str(getattr(ser, "port", "") or ""))
+    path = f"/sys/bus/usb-serial/devices/{tty}/latency_timer"
+    if not tty or not os.path.exists(path):
+        return
+    try:
+        with open(path, "r") as f:
+            current = f.read().strip()
+        if current == "1":
+            return
+        with open(path, "w") as f:
+            f.write("1")
+        if status_cb:
+            status_cb(f"USB latency timer for {tty}: {current}ms -> 1ms")
+    except OSError as e:
+        if status_cb:
+            status_cb(f"Could not lower USB latency timer for {tty} ({e}).")
+
+
+# The safe SEQNUM_RESET packet is a pure constant; compute it once at import.
+_SAFE_SEQNUM_RESET_SEQNUM, _SAFE_SEQNUM_RESET_MSG = _build_safe_seqnum_reset()
+
+
+class _BackendVarCache:
+    """Cached read of app.backend_var for the serial keepalive loops, hitting Tcl at most every 0.5s."""
+
+    def __init__(self, app, refresh_s=0.5):
+        self._app = app
+        self._refresh_s = refresh_s
+        self._value = "USB Serial"
+        self._checked_at = 0.0
+
+    def usb_serial_selected(self):
+        app = self._app
+        if not (app and getattr(app, "backend_var", None)):
+            return True
+        now = time.monotonic()
+        if now - self._checked_at > self._refresh_s:
+            self._value = app.backend_var.get()
+            self._checked_at = now
+        return self._value == "USB Serial"
+
+
 class UsbTxSerialBackend:
     def __init__(self, status_cb=None, app=None):
         self.status_cb = status_cb or (lambda s: None)
         self.app = app or (lambda s: None)
         self.ser = None
         self.interval_s = 0.05
+        # Resend an unchanged state at most this often.
+        self.heartbeat_s = 0.25
 
         self._lock = threading.Lock()
+        # Wakes the keepalive early (state change or disconnect).
+        self._wake = threading.Event()
         self._running = False
         self._thread = None
 
-        self._high = 0
-        self._low = 0
+        # Desired state packed as (high << 8) | low, and (state, sent_at) of the
+        # last packet written. Each is a single attribute store, so the
+        # keepalive can read them without the lock; _lock serialises writers.
+        self._state = 0
+        self._last_sent = (None, 0.0)
+
+        # Reused packet buffers; only the payload bytes change per send.
+        self._tx_buf = bytearray(b"\x54\x00\x00")
+        self._chan_buf = bytearray(b"\x43\x00\x00")
+        # Raw POSIX fd for the button packet hot path; None means use ser.write.
+        self._fd = None
 
         # Keepalive pause mechanism for thread-safe script commands
         self._keepalive_paused = False
         self._keepalive_pause_lock = threading.Lock()
 
+        self._backend_var = _BackendVarCache(self.app)
+
     @property
     def connected(self):
         return self.ser is not None and self.ser.is_open
 
-    def _send_packet(self, high, low):
-        """Immediately send a packet to the serial device."""
+    def _write_tx_buf(self):
+        """Write the 3-byte packet; return True only if all of it went out."""
+        if self._fd is not None:
+            try:
+                written = os.write(self._fd, self._tx_buf)
+            except BlockingIOError:
+                return False  # Kernel buffer full
+        else:
+            written = self.ser.write(self._tx_buf)
+        return written is None or written == len(self._tx_buf)
+
+    def _send_packet(self, state):
+        """Immediately send a packet to the serial device. Call with _lock held."""
         if not self.connected:
             return
         try:
-            self.ser.write(bytearray([0x54, high & 0xFF, low & 0xFF]))
-            self.ser.flush()  # Ensure immediate transmission
+            self._tx_buf[1] = state >> 8
+            self._tx_buf[2] = state & 0xFF
+            # A short or blocked write leaves _last_sent behind _state, so the
+            # keepalive (woken by set_state) retries it on its next interval
+            if self._write_tx_buf():
+                self._last_sent = (state, time.monotonic())
         except Exception as e:
             self.status_cb(f"Serial write error: {e}")
 
     def set_state(self, high, low):
         """Set button state and immediately send to device."""
+        state = ((high & 0xFF) << 8) | (low & 0xFF)
         with self._lock:
-            self._high = high & 0xFF
-            self._low = low & 0xFF
+            self._state = state
             # Immediately send the new state
-            self._send_packet(self._high, self._low)
+            self._send_packet(state)
+        self._wake.set()
 
     def set_buttons(self, buttons):
         """Set buttons and immediately send to device."""
@@ -134,18 +284,23 @@ class UsbTxSerialBackend:
         ser.port = port
         ser.baudrate = baud
         ser.timeout = 1
+        # Set before open(): pyserial applies these while opening, so the
+        # control lines never pulse (which would reset Arduino-style boards).
         try:
             ser.dtr = False
             ser.rts = False
         except Exception:
             pass
         ser.open()
-        try:
-            ser.dtr = False
-            ser.rts = False
-        except Exception:
-            pass
+        _enable_low_latency(ser)
+        _lower_usb_serial_latency_timer(ser, self.status_cb)
         self.ser = ser
+        self._fd = None
+        if os.name == "posix":
+            try:
+                self._fd = ser.fileno()
+            except Exception:
+                self._fd = None
         self.status_cb(f"USB TX serial connected: {port} @ {baud}")
 
         self._running = True
@@ -160,23 +315,29 @@ class UsbTxSerialBackend:
 
     def disconnect(self):
         self._running = False
+        self._wake.set()
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=1.0)
 
         if self.ser:
+            try:
+                self.ser.flush()  # Drain any queued packets before closing
+            except Exception:
+                pass
             try:
                 self.ser.close()
             except Exception:
                 pass
         self.ser = None
+        self._fd = None
         self.status_cb("USB TX serial disconnected.")
 
     def send_channel_set(self, channel_byte):
         if not self.connected:
             raise RuntimeError("Not connected.")
         ch = int(channel_byte) & 0xFF
-        pkt = bytearray([0x43, ch, 0x00])
-        self.ser.write(pkt)
+        self._chan_buf[1] = ch
+        self.ser.write(self._chan_buf)
         self.ser.flush()
         self.status_cb(f"Sent channel set: 0x{ch:02X} (power cycle receiver required)")
 
@@ -194,24 +355,38 @@ class UsbTxSerialBackend:
         while self._running:
             if not self.connected:
                 break
-            if self.app and getattr(self.app, "backend_var", None):
-                if self.app.backend_var.get() != "USB Serial":
-                    break
+            if not self._backend_var.usb_serial_selected():
+                break
             # Skip sending if keepalive is paused (script command in progress)
             with self._keepalive_pause_lock:
                 paused = self._keepalive_paused
             if paused:
-                time.sleep(self.interval_s)
+                self._wake.wait(self.interval_s)
+                self._wake.clear()
                 continue
-            with self._lock:
-                high = self._high
-                low = self._low
-            try:
-                self.ser.write(bytearray([0x54, high, low]))
-            except Exception as e:
-                self.status_cb(f"Serial write error: {e}")
-                break
-            time.sleep(self.interval_s)
+            # set_state() already sent this state; only heartbeat it.
+            last_state, last_sent_at = self._last_sent
+            if self._state != last_state or time.monotonic() - last_sent_at >= self.heartbeat_s:
+                try:
+                    with self._lock:
+                        state = self._state
+                        self._tx_buf[1] = state >> 8
+                        self._tx_buf[2] = state & 0xFF
+                        if self._write_tx_buf():
+                            self._last_sent = (state, time.monotonic())
+                except Exception as e:
+                    self.status_cb(f"Serial write error: {e}")
+                    break
+            # Sleep until the next heartbeat is due; set_state() pushes the
+            # deadline back, so this only wakes while the state sits unchanged.
+            # A state that did not go out in full is retried after one interval.
+            last_state, last_sent_at = self._last_sent
+            if last_state != self._state:
+                wait_s = self.interval_s
+            else:
+                wait_s = last_sent_at + self.heartbeat_s - time.monotonic()
+            self._wake.wait(max(self.interval_s, wait_s))
+            self._wake.clear()
 
 
 class PABotBaseSerialBackend:
@@ -230,24 +405,22 @@ class PABotBaseSerialBackend:
 
         self._lock = threading.Lock()
         self._io_lock = threading.Lock()
-        self._send_event = threading.Event()
+        # Guards _state; the keepalive sleeps on it until a setter marks it dirty
+        # or the next hold refresh is due.
+        self._cv = threading.Condition(self._lock)
+        self._dirty = False
+        self._idle_wait_s = 0.25
         self._running = False
         self._thread = None
 
-        self._buttons = pabotbase.Button.NONE
-        self._dpad = pabotbase.DPad.NONE
-        self._left_x = pabotbase.STICK_CENTER
-        self._left_y = pabotbase.STICK_CENTER
-        self._right_x = pabotbase.STICK_CENTER
-        self._right_y = pabotbase.STICK_CENTER
-        self._last_sent_buttons = pabotbase.Button.NONE
-        self._last_sent_dpad = pabotbase.DPad.NONE
-        self._last_sent_left_x = pabotbase.STICK_CENTER
-        self._last_sent_left_y = pabotbase.STICK_CENTER
-        self._last_sent_right_x = pabotbase.STICK_CENTER
-        self._last_sent_right_y = pabotbase.STICK_CENTER
-        self._last_sent_at = 0.0
-        self._last_sent_duration_ms = 0
+        # Desired and last-sent state are each stored as one tuple so the
+        # keepalive thread can snapshot them with a single attribute read.
+        # _state: (buttons, dpad, left_x, left_y, right_x, right_y)
+        # _last_sent: (state, sent_at, duration_ms); only the keepalive writes it.
+        self._state = self._NEUTRAL_STATE
+        self._last_sent = (self._NEUTRAL_STATE, 0.0, 0)
+        # press_buttons() bypasses _last_sent; monotonic time its last press expires
+        self._timed_press_until = 0.0
         self._command_timeout_s = 0.2
         self._use_interrupt_on_change = True
         self._wait_for_ack = False
@@ -256,62 +429,66 @@ class PABotBaseSerialBackend:
         self._keepalive_paused = False
         self._keepalive_pause_lock = threading.Lock()
 
+        self._backend_var = _BackendVarCache(self.app)
+
     @property
     def connected(self):
         return self.ser is not None and self.ser.is_open and self.controller is not None
 
+    _NEUTRAL_STATE = (
+        pabotbase.Button.NONE,
+        pabotbase.DPad.NONE,
+        pabotbase.STICK_CENTER,
+        pabotbase.STICK_CENTER,
+        pabotbase.STICK_CENTER,
+        pabotbase.STICK_CENTER,
+    )
+
+    _BTN_MAPPING = {
+        "A": pabotbase.Button.A,
+        "B": pabotbase.Button.B,
+        "X": pabotbase.Button.X,
+        "Y": pabotbase.Button.Y,
+        "L": pabotbase.Button.L,
+        "R": pabotbase.Button.R,
+        "Start": pabotbase.Button.PLUS,
+        "Select": pabotbase.Button.MINUS,
+        "ZL": pabotbase.Button.ZL,
+        "ZR": pabotbase.Button.ZR,
+        "Home": pabotbase.Button.HOME,
+        "Capture": pabotbase.Button.CAPTURE,
+    }
+
+    # Indexed by (up << 3) | (down << 2) | (left << 1) | right.
+    # Opposing directions cancel each other out.
+    _DPAD_TABLE = (
+        pabotbase.DPad.NONE,        # ----
+        pabotbase.DPad.RIGHT,       # ---R
+        pabotbase.DPad.LEFT,        # --L-
+        pabotbase.DPad.NONE,        # --LR
+        pabotbase.DPad.DOWN,        # -D--
+        pabotbase.DPad.DOWN_RIGHT,  # -D-R
+        pabotbase.DPad.DOWN_LEFT,   # -DL-
+        pabotbase.DPad.DOWN,        # -DLR
+        pabotbase.DPad.UP,          # U---
+        pabotbase.DPad.UP_RIGHT,    # U--R
+        pabotbase.DPad.UP_LEFT,     # U-L-
+        pabotbase.DPad.UP,          # U-LR
+        pabotbase.DPad.NONE,        # UD--
+        pabotbase.DPad.RIGHT,       # UD-R
+        pabotbase.DPad.LEFT,        # UDL-
+        pabotbase.DPad.NONE,        # UDLR
+    )
+
     def _buttons_to_state(self, buttons):
         btns = pabotbase.Button.NONE
-        dpad = pabotbase.DPad.NONE
-
-        mapping = {
-            "A": pabotbase.Button.A,
-            "B": pabotbase.Button.B,
-            "X": pabotbase.Button.X,
-            "Y": pabotbase.Button.Y,
-            "L": pabotbase.Button.L,
-            "R": pabotbase.Button.R,
-            "Start": pabotbase.Button.PLUS,
-            "Select": pabotbase.Button.MINUS,
-            "ZL": pabotbase.Button.ZL,
-            "ZR": pabotbase.Button.ZR,
-            "Home": pabotbase.Button.HOME,
-            "Capture": pabotbase.Button.CAPTURE,
-        }
+        mapping = self._BTN_MAPPING
 
         up = "Up" in buttons
         down = "Down" in buttons
         left = "Left" in buttons
         right = "Right" in buttons
-
-        vertical = None
-        if up and not down:
-            vertical = "up"
-        elif down and not up:
-            vertical = "down"
-
-        horizontal = None
-        if right and not left:
-            horizontal = "right"
-        elif left and not right:
-            horizontal = "left"
-
-        if vertical == "up" and horizontal == "right":
-            dpad = pabotbase.DPad.UP_RIGHT
-        elif vertical == "up" and horizontal == "left":
-            dpad = pabotbase.DPad.UP_LEFT
-        elif vertical == "down" and horizontal == "right":
-            dpad = pabotbase.DPad.DOWN_RIGHT
-        elif vertical == "down" and horizontal == "left":
-            dpad = pabotbase.DPad.DOWN_LEFT
-        elif vertical == "up":
-            dpad = pabotbase.DPad.UP
-        elif vertical == "down":
-            dpad = pabotbase.DPad.DOWN
-        elif horizontal == "right":
-            dpad = pabotbase.DPad.RIGHT
-        elif horizontal == "left":
-            dpad = pabotbase.DPad.LEFT
+        dpad = self._DPAD_TABLE[(up << 3) | (down << 2) | (left << 1) | right]
 
         for b in buttons:
             if b in mapping:
@@ -320,12 +497,16 @@ class PABotBaseSerialBackend:
         return btns, dpad
 
     def _stick_axis_to_byte(self, v):
-        try:
-            value = float(v)
-        except (TypeError, ValueError):
-            value = 0.0
-        value = max(-1.0, min(1.0, value))
-        return int(round((value + 1.0) * 127.5))
+        if not isinstance(v, (int, float)):
+            try:
+                v = float(v)
+            except (TypeError, ValueError):
+                return pabotbase.STICK_CENTER
+        if v <= -1.0:
+            return 0
+        if v >= 1.0 or v != v:  # NaN clamps high, as max/min did
+            return 255
+        return round((v + 1.0) * 127.5)
 
     def _drain_serial_input_locked(self):
         if not self.ser:
@@ -394,6 +575,8 @@ class PABotBaseSerialBackend:
             self.disconnect()
 
         self.ser = serial.Serial(port, baud, timeout=0)
+        _enable_low_latency(self.ser)
+        _lower_usb_serial_latency_timer(self.ser, self.status_cb)
         self.controller = pabotbase.PABotBaseController(self.ser)
         if not self.controller.connect():
             try:
@@ -415,7 +598,9 @@ class PABotBaseSerialBackend:
 
     def disconnect(self):
         self._running = False
-        self._send_event.set()
+        with self._cv:
+            self._dirty = True
+            self._cv.notify()
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=1.0)
 
@@ -424,10 +609,14 @@ class PABotBaseSerialBackend:
                 self.controller.stop_all_commands()
             except Exception:
                 pass
-            try:
-                self.controller.reset_to_neutral()
-            except Exception:
-                pass
+            # Skip the extra round trip if the device was last left at neutral
+            # and no timed press can still be held.
+            if (self._last_sent[0] != self._NEUTRAL_STATE
+                    or time.monotonic() < self._timed_press_until):
+                try:
+                    self.controller.reset_to_neutral()
+                except Exception:
+                    pass
 
         if self.ser:
             try:
@@ -438,6 +627,16 @@ class PABotBaseSerialBackend:
         self.controller = None
         self.status_cb("PABotBase serial disconnected.")
 
+    def _apply_state(self, update):
+        """Replace the desired state with update(old) and wake the keepalive if it changed."""
+        with self._cv:
+            old = self._state
+            new = update(old)
+            self._state = new
+            if new != old:
+                self._dirty = True
+                self._cv.notify()
+
     def set_state(self, high, low):
         buttons = bytes_to_buttons(high, low)
         self.set_buttons(buttons)
@@ -446,24 +645,14 @@ class PABotBaseSerialBackend:
         if not self.connected:
             return
         btns, dpad = self._buttons_to_state(buttons)
-        with self._lock:
-            state_changed = (btns != self._buttons) or (dpad != self._dpad)
-            self._buttons = btns
-            self._dpad = dpad
-        if state_changed:
-            self._send_event.set()
+        self._apply_state(lambda old: (btns, dpad) + old[2:])
 
     def set_left_stick(self, x, y):
         if not self.connected:
             return
         left_x = self._stick_axis_to_byte(x)
         left_y = self._stick_axis_to_byte(-y)
-        with self._lock:
-            state_changed = (left_x != self._left_x) or (left_y != self._left_y)
-            self._left_x = left_x
-            self._left_y = left_y
-        if state_changed:
-            self._send_event.set()
+        self._apply_state(lambda old: old[:2] + (left_x, left_y) + old[4:])
 
     def reset_left_stick(self):
         self.set_left_stick(0.0, 0.0)
@@ -473,12 +662,7 @@ class PABotBaseSerialBackend:
             return
         right_x = self._stick_axis_to_byte(x)
         right_y = self._stick_axis_to_byte(-y)
-        with self._lock:
-            state_changed = (right_x != self._right_x) or (right_y != self._right_y)
-            self._right_x = right_x
-            self._right_y = right_y
-        if state_changed:
-            self._send_event.set()
+        self._apply_state(lambda old: old[:4] + (right_x, right_y))
 
     def reset_right_stick(self):
         self.set_right_stick(0.0, 0.0)
@@ -487,11 +671,8 @@ class PABotBaseSerialBackend:
         if not self.connected:
             return
         btns, dpad = self._buttons_to_state(buttons)
-        with self._lock:
-            left_x = self._left_x
-            left_y = self._left_y
-            right_x = self._right_x
-            right_y = self._right_y
+        left_x, left_y, right_x, right_y = self._state[2:]
+        self._timed_press_until = max(self._timed_press_until, time.monotonic() + duration_ms / 1000.0)
         self._send_state(btns, dpad, left_x, left_y, right_x, right_y, duration_ms)
 
     def send_channel_set(self, channel_byte):
@@ -500,23 +681,7 @@ class PABotBaseSerialBackend:
     def reset_neutral(self):
         if not self.connected:
             return
-        with self._lock:
-            state_changed = (
-                self._buttons != pabotbase.Button.NONE
-                or self._dpad != pabotbase.DPad.NONE
-                or self._left_x != pabotbase.STICK_CENTER
-                or self._left_y != pabotbase.STICK_CENTER
-                or self._right_x != pabotbase.STICK_CENTER
-                or self._right_y != pabotbase.STICK_CENTER
-            )
-            self._buttons = pabotbase.Button.NONE
-            self._dpad = pabotbase.DPad.NONE
-            self._left_x = pabotbase.STICK_CENTER
-            self._left_y = pabotbase.STICK_CENTER
-            self._right_x = pabotbase.STICK_CENTER
-            self._right_y = pabotbase.STICK_CENTER
-        if state_changed:
-            self._send_event.set()
+        self._apply_state(lambda old: self._NEUTRAL_STATE)
 
     def pause_keepalive(self):
         """Pause the keepalive loop for thread-safe script commands."""
@@ -528,16 +693,31 @@ class PABotBaseSerialBackend:
         with self._keepalive_pause_lock:
             self._keepalive_paused = False
 
+    def _keepalive_wait_s(self):
+        """How long the keepalive can sleep before it has work to do."""
+        state = self._state
+        last_state, last_sent_at, last_duration_ms = self._last_sent
+        if state != last_state:
+            # Unsent change (paused or a failed send): retry at the normal rate.
+            return self.interval_s
+        if state == self._NEUTRAL_STATE:
+            return self._idle_wait_s
+        if last_sent_at == 0.0:
+            return 0.0
+        refresh_at = last_sent_at + max(0.0, last_duration_ms / 1000.0 - self._refresh_margin_s)
+        return max(0.0, min(self._idle_wait_s, refresh_at - time.monotonic()))
+
     def _keepalive_loop(self):
         while self._running:
             if not self.connected:
                 break
-            if self.app and getattr(self.app, "backend_var", None):
-                if self.app.backend_var.get() != "USB Serial":
-                    break
+            if not self._backend_var.usb_serial_selected():
+                break
 
-            self._send_event.wait(self.interval_s)
-            self._send_event.clear()
+            with self._cv:
+                if not self._dirty:
+                    self._cv.wait(self._keepalive_wait_s())
+                self._dirty = False
 
             if not self.connected:
                 break
@@ -549,30 +729,11 @@ class PABotBaseSerialBackend:
                 continue
 
             now = time.monotonic()
-            with self._lock:
-                btns = self._buttons
-                dpad = self._dpad
-                left_x = self._left_x
-                left_y = self._left_y
-                right_x = self._right_x
-                right_y = self._right_y
-                last_btns = self._last_sent_buttons
-                last_dpad = self._last_sent_dpad
-                last_left_x = self._last_sent_left_x
-                last_left_y = self._last_sent_left_y
-                last_right_x = self._last_sent_right_x
-                last_right_y = self._last_sent_right_y
-                last_sent_at = self._last_sent_at
-                last_duration_ms = self._last_sent_duration_ms
-
-            state_changed = (
-                btns != last_btns
-                or dpad != last_dpad
-                or left_x != last_left_x
-                or left_y != last_left_y
-                or right_x != last_right_x
-                or right_y != last_right_y
-            )
+            state = self._state
+            last_state, last_sent_at, last_duration_ms = self._last_sent
+            btns, dpad, left_x, left_y, right_x, right_y = state
+
+            state_changed = state != last_state
             send_needed = False
             send_interrupt = False
 
@@ -584,14 +745,7 @@ class PABotBaseSerialBackend:
             active = duration_s > 0 and elapsed < duration_s
 
             refresh_due = False
-            has_input = (
-                btns != pabotbase.Button.NONE
-                or dpad != pabotbase.DPad.NONE
-                or left_x != pabotbase.STICK_CENTER
-                or left_y != pabotbase.STICK_CENTER
-                or right_x != pabotbase.STICK_CENTER
-                or right_y != pabotbase.STICK_CENTER
-            )
+            has_input = state != self._NEUTRAL_STATE
             if has_input:
                 if last_sent_at == 0.0:
                     refresh_due = True
@@ -618,15 +772,7 @@ class PABotBaseSerialBackend:
                     interrupt_next=send_interrupt,
                 )
                 if ok:
-                    with self._lock:
-                        self._last_sent_buttons = btns
-                        self._last_sent_dpad = dpad
-                        self._last_sent_left_x = left_x
-                        self._last_sent_left_y = left_y
-                        self._last_sent_right_x = right_x
-                        self._last_sent_right_y = right_y
-                        self._last_sent_at = time.monotonic()
-                        self._last_sent_duration_ms = self._hold_duration_ms
+                    self._last_sent = (state, time.monotonic(), self._hold_duration_ms)
 
 
 class SerialController:
@@ -634,26 +780,31 @@ class SerialController:
         self.status_cb = status_cb or (lambda s: None)
         self.app = app or (lambda s: None)
         self.backend = None
+        self._caps = 0
         self.usbtx_serial = None
         self.pabotbase_serial = None
         self._debug_enabled = True
+        # (port, hwid) -> "pabotbase" | "usbtx" for ports already probed this session
+        self._probe_cache = {}
+
+    def _set_backend(self, backend):
+        self.backend = backend
+        self._caps = _backend_caps(backend)
 
     def _open_serial_no_reset(self, port, baud, timeout=0):
         ser = serial.Serial()
         ser.port = port
         ser.baudrate = baud
         ser.timeout = timeout
+        # Set before open(): pyserial applies these while opening, so the
+        # control lines never pulse (which would reset Arduino-style boards).
         try:
             ser.dtr = False
             ser.rts = False
         except Exception:
             pass
         ser.open()
-        try:
-            ser.dtr = False
-            ser.rts = False
-        except Exception:
-            pass
+        _enable_low_latency(ser)
         return ser
 
     def _debug(self, msg):
@@ -698,6 +849,14 @@ class SerialController:
         if info is None:
             return True, "safe probe (no port info)"
 
+        if self._matches_pabotbase_hints(info):
+            return True, "hint match"
+
+        return True, "safe probe (default)"
+
+    def _matches_pabotbase_hints(self, info):
+        if info is None:
+            return False
         haystack = " ".join(
             str(x).lower()
             for x in (
@@ -707,45 +866,82 @@ class SerialController:
                 getattr(info, "hwid", ""),
             )
         )
-        if any(hint in haystack for hint in PABOTBASE_HINTS):
-            return True, "hint match"
+        return any(hint in haystack for hint in PABOTBASE_HINTS)
 
-        return True, "safe probe (default)"
+    def clear_probe_cache(self):
+        """Forget probe results so the next connect to each port probes again."""
+        self._probe_cache.clear()
+
+    def _serial_fd(self, ser):
+        """Return a selectable file descriptor for ser, or None (e.g. Windows COM ports)."""
+        if os.name != "posix":
+            return None
+        try:
+            return ser.fileno()
+        except Exception:
+            return None
 
     def _read_pabotbase_response(self, ser, timeout_s, max_log_bytes=64, accept_fn=None):
-        start = time.time()
+        end_ns = time.monotonic_ns() + int(timeout_s * 1_000_000_000)
         buffer = bytearray()
         raw_log = bytearray()
-        packet=[]
-        packet.append(0x54) # Transmit
-        packet.append(0x00) # High byte
-        packet.append(0x00) # Low byte
-        
-        while (time.time() - start) < timeout_s:
-            ser.write(packet) # Send a dummy packet to elicit a response (if any)
-            waiting = ser.in_waiting
-            if waiting:
-                data = ser.read(waiting)
-                buffer.extend(data)
-                if len(raw_log) < max_log_bytes:
-                    raw_log.extend(data[: max_log_bytes - len(raw_log)])
+        packet = _USB_TX_NEUTRAL_PACKET
+        fd = self._serial_fd(ser)
+        scan_start = 0
 
-            for i in range(len(buffer)):
-                length_inverted = buffer[i]
-                expected_length = (~length_inverted) & 0xFF
-
-                if expected_length == 0 or expected_length > pabotbase.MAX_PACKET_SIZE:
-                    continue
-                if i + expected_length <= len(buffer):
-                    msg_data = bytes(buffer[i:i + expected_length])
-                    message = pabotbase.PABotBaseMessage.decode(msg_data)
-                    if message is not None:
-                        del buffer[:i + expected_length]
-                        if accept_fn is None or accept_fn(message):
-                            return message, bytes(raw_log)
-                        break
-
-            time.sleep(0.001)
+        original_timeout = ser.timeout
+        if fd is None:
+            ser.timeout = min(0.005, timeout_s)
+        try:
+            while time.monotonic_ns() < end_ns:
+                ser.write(packet) # Send a dummy packet to elicit a response (if any)
+                data = b""
+                if fd is not None:
+                    # Block in the kernel until bytes arrive; wake at least every
+                    # 10ms so the dummy packet keeps being sent.
+                    remaining_ns = end_ns - time.monotonic_ns()
+                    ready, _, _ = select.select([fd], [], [], max(0, min(10_000_000, remaining_ns)) / 1e9)
+                    if ready:
+                        data = os.read(fd, 4096)
+                else:
+                    # Short blocking read of up to one packet instead of
+                    # polling in_waiting.
+                    data = ser.read(pabotbase.MAX_PACKET_SIZE)
+                if data:
+                    buffer.extend(data)
+                    if len(raw_log) < max_log_bytes:
+                        raw_log.extend(data[: max_log_bytes - len(raw_log)])
+
+                # Offsets before scan_start were already rejected outright; only
+                # offsets still waiting on more bytes need to be looked at again.
+                pending = False
+                for i in range(scan_start, len(buffer)):
+                    length_inverted = buffer[i]
+                    expected_length = (~length_inverted) & 0xFF
+
+                    if expected_length == 0 or expected_length > pabotbase.MAX_PACKET_SIZE:
+                        if not pending:
+                            scan_start = i + 1
+                        continue
+                    if i + expected_length <= len(buffer):
+                        msg_data = bytes(buffer[i:i + expected_length])
+                        message = pabotbase.PABotBaseMessage.decode(msg_data)
+                        if message is not None:
+                            del buffer[:i + expected_length]
+                            scan_start = 0
+                            if accept_fn is None or accept_fn(message):
+                                return message, bytes(raw_log)
+                            break
+                        if not pending:
+                            scan_start = i + 1
+                    else:
+                        pending = True
+        finally:
+            if fd is None:
+                try:
+                    ser.timeout = original_timeout
+                except Exception:
+                    pass
 
         return None, bytes(raw_log)
 
@@ -755,10 +951,10 @@ class SerialController:
 
     @property
     def supports_timed_press(self):
-        return bool(getattr(self.backend, "supports_timed_press", False))
+        return bool(self._caps & _CAP_TIMED_PRESS)
 
     def _probe_pabotbase(self, port, timeout_s=0.25, allow_write=False):
-        seqnum, message = _build_safe_seqnum_reset()
+        seqnum, message = _SAFE_SEQNUM_RESET_SEQNUM, _SAFE_SEQNUM_RESET_MSG
         if message is None:
             self._debug("PABotBase probe: failed to build safe SEQNUM_RESET.")
             return False
@@ -866,39 +1062,61 @@ class SerialController:
             self.disconnect()
 
         port_info = self._get_port_info(port)
-        self._debug(f"Serial connect: probing {port}.")
-        if port_info:
-            self._debug(f"Serial connect: port info: {self._format_port_info(port_info)}")
-        allow_write, reason = False, "default to no-write probe"
-        if not allow_write:
-            self._debug(f"Serial connect: PABotBase probe write disabled ({reason}).")
-        if self._probe_pabotbase(port, allow_write=allow_write):
+        cache_key = (port, getattr(port_info, "hwid", "") or "")
+        override = os.environ.get("CMR_PABOTBASE_PROBE", "").strip().lower()
+        cached = None if override == "force" else self._probe_cache.get(cache_key)
+
+        if cached is not None:
+            self._debug(f"Serial connect: using cached probe result for {port} ({cached}).")
+            is_pabotbase = cached == "pabotbase"
+        else:
+            self._debug(f"Serial connect: probing {port}.")
+            if port_info:
+                self._debug(f"Serial connect: port info: {self._format_port_info(port_info)}")
+            allow_write, reason = False, "default to no-write probe"
+            if not allow_write:
+                self._debug(f"Serial connect: PABotBase probe write disabled ({reason}).")
+            is_pabotbase = self._probe_pabotbase(port, allow_write=allow_write)
+
+        if is_pabotbase:
             self._debug("Serial connect: PABotBase detected.")
             self.pabotbase_serial = PABotBaseSerialBackend(status_cb=self.status_cb, app=self.app)
-            self.pabotbase_serial.connect(port)
-            self.backend = self.pabotbase_serial
+            try:
+                self.pabotbase_serial.connect(port)
+            except Exception:
+                self._probe_cache.pop(cache_key, None)
+                raise
+            self._set_backend(self.pabotbase_serial)
+            self._probe_cache[cache_key] = "pabotbase"
             return
 
         self._debug("Serial connect: falling back to USB TX.")
         self.usbtx_serial = UsbTxSerialBackend(status_cb=self.status_cb, app=self.app)
         try:
             self.usbtx_serial.connect(port, baud=baud)
-            self.backend = self.usbtx_serial
+            self._set_backend(self.usbtx_serial)
         except Exception:
             self.usbtx_serial = None
+            self._probe_cache.pop(cache_key, None)
             raise
+        # A port that looks like a PABotBase board may just not have answered
+        # yet (e.g. still booting), so probe it again on the next connect.
+        if self._matches_pabotbase_hints(port_info):
+            self._probe_cache.pop(cache_key, None)
+        else:
+            self._probe_cache[cache_key] = "usbtx"
 
     def disconnect(self):
         if self.backend:
             self.backend.disconnect()
-        self.backend = None
+        self._set_backend(None)
         self.usbtx_serial = None
         self.pabotbase_serial = None
 
     def set_state(self, high, low):
         if not self.backend:
             return
-        if hasattr(self.backend, "set_state"):
+        if self._caps & _CAP_SET_STATE:
             self.backend.set_state(high, low)
         else:
             self.set_buttons(bytes_to_buttons(high, low))
@@ -911,17 +1129,17 @@ class SerialController:
     def set_left_stick(self, x, y):
         if not self.backend:
             raise RuntimeError("Not connected.")
-        if not hasattr(self.backend, "set_left_stick"):
+        if not self._caps & _CAP_SET_LEFT_STICK:
             raise RuntimeError("Left stick is not supported by this backend.")
         self.backend.set_left_stick(x, y)
 
     def reset_left_stick(self):
         if not self.backend:
             raise RuntimeError("Not connected.")
-        if hasattr(self.backend, "reset_left_stick"):
+        if self._caps & _CAP_RESET_LEFT_STICK:
             self.backend.reset_left_stick()
             return
-        if hasattr(self.backend, "set_left_stick"):
+        if self._caps & _CAP_SET_LEFT_STICK:
             self.backend.set_left_stick(0.0, 0.0)
             return
         raise RuntimeError("Left stick is not supported by this backend.")
@@ -929,17 +1147,17 @@ class SerialController:
     def set_right_stick(self, x, y):
         if not self.backend:
             raise RuntimeError("Not connected.")
-        if not hasattr(self.backend, "set_right_stick"):
+        if not self._caps & _CAP_SET_RIGHT_STICK:
             raise RuntimeError("Right stick is not supported by this backend.")
         self.backend.set_right_stick(x, y)
 
     def reset_right_stick(self):
         if not self.backend:
             raise RuntimeError("Not connected.")
-        if hasattr(self.backend, "reset_right_stick"):
+        if self._caps & _CAP_RESET_RIGHT_STICK:
             self.backend.reset_right_stick()
             return
-        if hasattr(self.backend, "set_right_stick"):
+        if self._caps & _CAP_SET_RIGHT_STICK:
             self.backend.set_right_stick(0.0, 0.0)
             return
         raise RuntimeError("Right stick is not supported by this backend.")
@@ -957,7 +1175,7 @@ class SerialController:
     def reset_neutral(self):
         if not self.backend:
             return
-        if hasattr(self.backend, "reset_neutral"):
+        if self._caps & _CAP_RESET_NEUTRAL:
             self.backend.reset_neutral()
         else:
             self.set_buttons([])
@@ -966,12 +1184,12 @@ class SerialController:
         """Pause the keepalive loop for thread-safe script commands."""
         if not self.backend:
             return
-        if hasattr(self.backend, "pause_keepalive"):
+        if self._caps & _CAP_PAUSE_KEEPALIVE:
             self.backend.pause_keepalive()
 
     def resume_keepalive(self):
         """Resume the keepalive loop after script commands complete."""
         if not self.backend:
             return
-        if hasattr(self.backend, "resume_keepalive"):
+        if self._caps & _CAP_RESUME_KEEPALIVE:
             self.backend.resume_keepalive()
@@ -4,6 +4,7 @@ Handles audio device enumeration and passthrough.
 """
 
 import re
+import time
 
 # Audio support (optional)
 try:
@@ -13,8 +14,23 @@ except ImportError:
     PYAUDIO_AVAILABLE = False
     pyaudio = None
 
+# Name filters for legacy/system devices that Windows Sound settings hides
+_SKIP_NAME_PATTERNS = (
+    'Microsoft Sound Mapper',
+    'Primary Sound',  # Primary Sound Capture Driver, etc.
+    '@System32\\drivers\\',  # System driver devices
+    'Stereo Mix',  # Loopback devices
+)
+_UNAVAILABLE_INDICATORS = ('(unplugged)', '(disabled)', '(not present)')
+# Numbered duplicate arrays, e.g. names ending with " 1 ()"
+_DUP_RE = re.compile(r'\s+\d+\s*\(\s*\)$')
 
-def list_audio_devices():
+# Last enumeration result; PortAudio device walks are slow and devices rarely change.
+_DEVICE_CACHE_TTL_S = 5.0
+_device_cache = {"ts": 0.0, "val": None}
+
+
+def list_audio_devices(force=False):
     """
     Returns (input_devices, output_devices) as lists of (index, name) tuples.
     Filters devices to match Windows Sound System by:
@@ -22,10 +38,23 @@ def list_audio_devices():
     - Filtering out legacy MME/DirectSound drivers
     - Removing duplicate device names
     - Excluding disabled, system, and virtual devices
+
+    Results are reused for a few seconds unless force=True.
     """
     if not PYAUDIO_AVAILABLE or pyaudio is None:
         return [], []
 
+    cached = _device_cache["val"]
+    if not force and cached is not None and time.monotonic() - _device_cache["ts"] < _DEVICE_CACHE_TTL_S:
+        return list(cached[0]), list(cached[1])
+
+    inputs, outputs = _enumerate_audio_devices()
+    _device_cache["ts"] = time.monotonic()
+    _device_cache["val"] = (inputs, outputs)
+    return list(inputs), list(outputs)
+
+
+def _enumerate_audio_devices():
     try:
         p = pyaudio.PyAudio()
 
@@ -70,22 +99,17 @@ def list_audio_devices():
                     continue
 
                 # Filter out legacy/system devices by name patterns
-                skip_patterns = [
-                    'Microsoft Sound Mapper',
-                    'Primary Sound',  # Primary Sound Capture Driver, etc.
-                    '@System32\\drivers\\',  # System driver devices
-                    'Stereo Mix',  # Loopback devices
-                ]
-                if any(pattern in name for pattern in skip_patterns):
+                if any(pattern in name for pattern in _SKIP_NAME_PATTERNS):
                     continue
 
                 # Filter out disabled/unavailable devices
-                if any(indicator in name.lower() for indicator in ['(unplugged)', '(disabled)', '(not present)']):
+                lower_name = name.lower()
+                if any(indicator in lower_name for indicator in _UNAVAILABLE_INDICATORS):
                     continue
 
                 # Filter out numbered duplicate arrays (e.g., "Microphone Array 1", "Microphone Array 2")
                 # These are internal channels that Windows Sound System doesn't show
-                if re.search(r'\s+\d+\s*\(\s*\)$', name):  # Ends with " 1 ()" or similar
+                if _DUP_RE.search(name):
                     continue
 
                 # Add input devices (avoid duplicates)
@@ -2,58 +2,232 @@
 Camera module for Controller Macro Runner.
 Handles camera device enumeration, video capture, and display.
 """
+import codecs
+import functools
+import os
+import re
 import subprocess
 import sys
+import threading
+import time
 import tkinter as tk
 from tkinter import ttk
 import json
 import numpy as np
 from PIL import Image, ImageTk
 
-from utils import ffmpeg_path
+from utils import ffmpeg_path, exe_dir_path, bgr_frame_to_image, mean_bgr_int
+
+# Optional OpenCV support for faster frame conversion
+try:
+    import cv2
+    CV2_AVAILABLE = True
+except ImportError:
+    CV2_AVAILABLE = False
 
 # Windows-specific flag to hide console window
 _SUBPROCESS_FLAGS = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
 
+# Resample only the final <=2x of a downscale; larger factors are box-reduced first
+_RESIZE_REDUCING_GAP = 2.0
+
+# Default cap on how often camera windows repaint, independent of camera FPS
+DEFAULT_MAX_REDRAW_HZ = 30
+# Fallback redraw period for the selector and picker windows, which otherwise redraw on new frames and input
+_SELECTOR_WATCHDOG_MS = 250
+# Shortest interval between redraws of the selector and picker windows
+_MIN_REDRAW_MS = 15
+
+
+# Last DirectShow enumeration result; ffmpeg takes about a second to list devices.
+_DSHOW_CACHE_TTL_S = 10.0
+# Upper bound on one ffmpeg device listing
+_DSHOW_LIST_TIMEOUT_S = 3.0
+_dshow_cache = {"ts": 0.0, "val": None}
+# Device list persisted between runs so startup can skip the ffmpeg spawn
+_DSHOW_DISK_CACHE_FILE = "camera_devices.json"
+_DSHOW_DISK_CACHE_TTL_S = 3600.0
+# ffmpeg output meaning no more video devices will follow: the audio section
+# has started, or video enumeration failed
+_DSHOW_STOP_RE = re.compile(
+    rb"DirectShow audio devices|\(audio\)$|Could not enumerate video devices|Unknown input format"
+)
+# Quoted device name on a video device line, e.g. [dshow @ ...] "USB Video" (video)
+_DSHOW_VIDEO_RE = re.compile(r'"(.+)"[^"]*\(video\)')
+
+
+def _redraw_interval_ms(max_hz=DEFAULT_MAX_REDRAW_HZ, app=None):
+    """
+    Minimum time between redraws of a camera window: no faster than max_hz, and
+    when app is given, no faster than its camera delivers frames.
+    """
+    if app is not None:
+        max_hz = min(max_hz, getattr(app, "camera_fps", 30) or 30)
+    return max(_MIN_REDRAW_MS, int(1000 / max_hz))
+
+
+def set_var_if_changed(var, text):
+    """
+    var.set(text) unless var already holds text; returns True if it was set.
+
+    Each set fires Tk variable traces and relayouts the bound label, which adds
+    up when called on every mouse event or redraw.
+    """
+    if var.get() == text:
+        return False
+    var.set(text)
+    return True
+
+
+def _ffmpeg_text_encoding():
+    """Encoding ffmpeg uses for device names on stderr (ANSI code page on Windows)."""
+    try:
+        codecs.lookup("mbcs")
+        return "mbcs"
+    except LookupError:
+        return "utf-8"
+
+
+def list_dshow_video_devices(force=False):
+    """
+    List DirectShow video devices using ffmpeg.
+
+    Results are reused for a few seconds in memory, and for up to an hour from
+    camera_devices.json across runs, unless force=True.
+    """
+    cached = _dshow_cache["val"]
+    if not force and cached is not None and time.monotonic() - _dshow_cache["ts"] < _DSHOW_CACHE_TTL_S:
+        return list(cached)
+
+    devices = None if force else _load_dshow_disk_cache()
+    if devices is None:
+        devices = _enumerate_dshow_video_devices()
+        _save_dshow_disk_cache(devices)
+    _dshow_cache["ts"] = time.monotonic()
+    _dshow_cache["val"] = devices
+    return list(devices)
+
+
+def _load_dshow_disk_cache():
+    """Device names from camera_devices.json if it is recent, else None."""
+    path = exe_dir_path(_DSHOW_DISK_CACHE_FILE)
+    try:
+        if time.time() - os.path.getmtime(path) >= _DSHOW_DISK_CACHE_TTL_S:
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            devices = json.load(f)
+    except Exception:
+        return None
+    if not devices or not isinstance(devices, list) or not all(isinstance(d, str) for d in devices):
+        return None
+    return devices
+
 
-def list_dshow_video_devices():
-    """List DirectShow video devices using ffmpeg."""
+def _save_dshow_disk_cache(devices):
+    """Write the device list atomically; empty results are not persisted."""
+    if not devices:
+        return
+    path = exe_dir_path(_DSHOW_DISK_CACHE_FILE)
+    tmp_path = path + ".tmp"
     try:
-        p = subprocess.run(
-            [ffmpeg_path(), "-list_devices", "true", "-f", "dshow", "-i", "dummy"],
-            capture_output=True,
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(devices, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except Exception:
+        pass
+
+
+def _enumerate_dshow_video_devices():
+    try:
+        p = subprocess.Popen(
+            [ffmpeg_path(), "-hide_banner", "-nostats", "-nostdin",
+             "-list_devices", "true", "-f", "dshow", "-i", "dummy"],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             creationflags=_SUBPROCESS_FLAGS
         )
-
     except FileNotFoundError:
         return []
 
-    raw = p.stderr or b""
-    try:
-        text = raw.decode("mbcs", errors="replace")
-    except Exception:
-        text = raw.decode("utf-8", errors="replace")
+    # A stalled DirectShow driver must not hang the caller; killing ffmpeg ends the read loop
+    killer = threading.Timer(_DSHOW_LIST_TIMEOUT_S, p.kill)
+    killer.daemon = True
+    killer.start()
 
     devices = []
-    for line in text.splitlines():
-        s = line.strip()
-        if "Alternative name" in s:
-            continue
-        if "(video)" not in s:
-            continue
-        first = s.find('"')
-        last = s.rfind('"')
-        if first != -1 and last != -1 and last > first:
-            name = s[first + 1:last].strip()
-            if name and name not in devices:
-                devices.append(name)
+    seen = set()
+    encoding = _ffmpeg_text_encoding()
+    try:
+        # Lines are filtered as bytes; only video device lines get decoded.
+        # Video devices are listed before audio ones; stop reading once audio starts.
+        for raw in p.stderr:
+            line = raw.strip()
+            if _DSHOW_STOP_RE.search(line):
+                break
+            if b"(video)" not in line or b"Alternative name" in line:
+                continue
+            m = _DSHOW_VIDEO_RE.search(line.decode(encoding, errors="replace"))
+            if m:
+                name = m.group(1).strip()
+                if name and name not in seen:
+                    seen.add(name)
+                    devices.append(name)
+    finally:
+        killer.cancel()
+        try:
+            if p.poll() is None:
+                p.terminate()
+            p.wait(timeout=2)
+        except Exception:
+            pass
+        try:
+            p.stderr.close()
+        except Exception:
+            pass
     return devices
 
 
-def scale_image_to_fit(img: Image.Image, max_width: int, max_height: int) -> Image.Image:
+@functools.lru_cache(maxsize=64)
+def _fit_size(orig_w, orig_h, max_width, max_height):
+    """
+    Target (width, height) for scale_image_to_fit, or None to leave the image as-is.
+
+    Source and display sizes rarely change while streaming, so the result is
+    memoized per (source, bounds) instead of being recomputed every frame.
+    """
+    # Fit whichever side is the tighter bound, using integer cross-multiplication
+    # so the bound side lands exactly on max_width/max_height (no float rounding).
+    if orig_w * max_height <= orig_h * max_width:
+        bound, orig_bound = max_height, orig_h
+        new_w = max(1, orig_w * max_height // orig_h)
+        new_h = max_height
+    else:
+        bound, orig_bound = max_width, orig_w
+        new_w = max_width
+        new_h = max(1, orig_h * max_width // orig_w)
+
+    # Don't upscale beyond 1.0 for main window, but allow for popout/fullscreen
+    # Actually, we want to allow scaling up for fullscreen, so no cap here
+
+    # An upscale within ~2% of native only blurs the frame; show it as-is. A frame
+    # that doesn't fit is always downscaled so it is never clipped.
+    if orig_w <= max_width and orig_h <= max_height and abs(bound - orig_bound) * 50 < orig_bound:
+        return None
+
+    if new_w == orig_w and new_h == orig_h:
+        return None
+    return new_w, new_h
+
+
+def scale_image_to_fit(img: Image.Image, max_width: int, max_height: int,
+                       resample=Image.Resampling.BILINEAR) -> Image.Image:
     """
     Scale an image to fit within max_width x max_height while preserving aspect ratio.
     Returns the scaled image.
+
+    BILINEAR is the default since this runs on every live preview frame; pass
+    Image.Resampling.LANCZOS for one-off, quality-sensitive resizes.
     """
     if max_width <= 0 or max_height <= 0:
         return img
@@ -62,21 +236,71 @@ def scale_image_to_fit(img: Image.Image, max_width: int, max_height: int) -> Ima
     if orig_w <= 0 or orig_h <= 0:
         return img
 
-    # Calculate scale factor to fit within bounds
-    scale_w = max_width / orig_w
-    scale_h = max_height / orig_h
-    scale = min(scale_w, scale_h)
+    size = _fit_size(orig_w, orig_h, max_width, max_height)
+    if size is None:
+        return img
 
-    # Don't upscale beyond 1.0 for main window, but allow for popout/fullscreen
-    # Actually, we want to allow scaling up for fullscreen, so no cap here
+    # On large downscales, box-reduce by an integer factor first (Image.reduce)
+    # and resample only the remaining step; has no effect when upscaling.
+    return img.resize(size, resample, reducing_gap=_RESIZE_REDUCING_GAP)
 
-    new_w = max(1, int(orig_w * scale))
-    new_h = max(1, int(orig_h * scale))
 
-    if new_w == orig_w and new_h == orig_h:
-        return img
+class FrameScaler:
+    """
+    Scales BGR frames (ndarrays) to fit a display area as RGB images, like scale_image_to_fit.
+
+    With OpenCV available, downscales are done with cv2.resize(INTER_AREA) on
+    the BGR array into a buffer kept between calls, and only that small result
+    is channel-swapped (by Pillow's BGR unpacker). The full-size frame is read
+    once and never converted to RGB.
+    """
 
-    return img.resize((new_w, new_h), Image.Resampling.LANCZOS)
+    def __init__(self):
+        self._buf = None
+
+    def scale(self, frame, max_width: int, max_height: int) -> Image.Image:
+        h, w = frame.shape[:2]
+        if CV2_AVAILABLE and max_width > 0 and max_height > 0 and w > 0 and h > 0:
+            size = _fit_size(w, h, max_width, max_height)
+            if size is not None and size[0] < w and size[1] < h:
+                shape = (size[1], size[0], frame.shape[2])
+                if self._buf is None or self._buf.shape != shape:
+                    self._buf = np.empty(shape, dtype=np.uint8)
+                cv2.resize(frame, size, dst=self._buf, interpolation=cv2.INTER_AREA)
+                return bgr_frame_to_image(self._buf)
+        return scale_image_to_fit(bgr_frame_to_image(frame), max_width, max_height,
+                                  resample=Image.Resampling.BILINEAR)
+
+
+class MotionCoalescer:
+    """
+    Event handler wrapper that runs handler(event) at most once per Tk idle cycle.
+
+    Fast mice deliver hundreds of <Motion> events per second; only the latest
+    one queued before Tk goes idle is handled. Call cancel() from <Leave>
+    handlers so a queued motion cannot undo them.
+    """
+
+    def __init__(self, widget, handler):
+        self._widget = widget
+        self._handler = handler
+        self._event = None
+        self._pending = False
+
+    def __call__(self, event):
+        self._event = event
+        if not self._pending:
+            self._pending = True
+            self._widget.after_idle(self._flush)
+
+    def cancel(self):
+        self._event = None
+
+    def _flush(self):
+        self._pending = False
+        event, self._event = self._event, None
+        if event is not None:
+            self._handler(event)
 
 
 class CameraPopoutWindow:
@@ -98,11 +322,13 @@ class CameraPopoutWindow:
         self.video_label.pack(fill=tk.BOTH, expand=True)
 
         # Bind events
-        self.video_label.bind("<Motion>", self._on_video_mouse_move)
+        self._motion = MotionCoalescer(self.window, self._on_video_mouse_move)
+        self.video_label.bind("<Motion>", self._motion)
         self.video_label.bind("<Leave>", self._on_video_mouse_leave)
         self.video_label.bind("<Button-1>", self._on_video_click)
         self.video_label.bind("<Shift-Button-1>", self._on_video_click_copy_json)
         self.video_label.bind("<Double-Button-1>", self._toggle_fullscreen)
+        self.video_label.bind("<Configure>", self._on_label_resize)
 
         # Bind ESC key to exit fullscreen
         self.window.bind("<Escape>", self._exit_fullscreen)
@@ -123,6 +349,35 @@ class CameraPopoutWindow:
         self._video_offset_y = 0
         self._last_video_xy = None
 
+        # Label size, tracked via <Configure> instead of querying Tk every frame
+        self._avail_w = 0
+        self._avail_h = 0
+
+        self._scaler = FrameScaler()
+
+        # Persistent Tk image, re-created only when the display size changes
+        self._tk_img = None
+        self._tk_img_size = (0, 0)
+
+        # Frames arriving faster than the redraw cap are deferred, not dropped;
+        # a pending paint always draws the newest frame
+        self._last_paint = 0.0
+        self._pending_frame = None
+        self._pending_seq = None
+        self._paint_after_id = None
+        # (frame_seq, width, height) last painted into _tk_img
+        self._drawn_key = None
+        self.set_max_redraw_hz(DEFAULT_MAX_REDRAW_HZ)
+
+    def set_max_redraw_hz(self, hz):
+        """Limit how many frames per second are painted."""
+        self.max_redraw_hz = max(1.0, float(hz))
+        self._min_interval = 1.0 / self.max_redraw_hz
+
+    def _on_label_resize(self, event):
+        self._avail_w = event.width
+        self._avail_h = event.height
+
     def _toggle_fullscreen(self, event=None):
         """Toggle between windowed and fullscreen mode"""
         if self.is_fullscreen:
@@ -148,15 +403,37 @@ class CameraPopoutWindow:
         self._exit_fullscreen()
         self.on_close_callback()
 
-    def update_frame(self, pil_img):
-        """Update the video display with a new frame, scaling to fit window and centering"""
-        if pil_img is None:
+    def update_frame(self, frame, seq=None):
+        """Update the video display with a new BGR frame, scaling to fit window and centering"""
+        if frame is None:
+            return
+
+        # Same frame at the same size is already on screen
+        if (seq is not None and self._tk_img is not None
+                and (seq, self._avail_w, self._avail_h) == self._drawn_key):
+            return
+
+        self._pending_frame = frame
+        self._pending_seq = seq
+        if self._paint_after_id is not None:
+            return
+        delay_ms = int((self._last_paint + self._min_interval - time.monotonic()) * 1000)
+        if delay_ms > 0:
+            self._paint_after_id = self.window.after(delay_ms, self._paint_pending_frame)
+            return
+        self._paint_pending_frame()
+
+    def _paint_pending_frame(self):
+        self._paint_after_id = None
+        frame, self._pending_frame = self._pending_frame, None
+        if frame is None:
             return
+        self._last_paint = time.monotonic()
+        self._drawn_key = (self._pending_seq, self._avail_w, self._avail_h)
 
         # Get available size for the video (window size minus coord bar)
-        self.window.update_idletasks()
-        available_w = self.video_label.winfo_width()
-        available_h = self.video_label.winfo_height()
+        available_w = self._avail_w
+        available_h = self._avail_h
 
         # Fallback to window size if label size not yet available
         if available_w <= 1 or available_h <= 1:
@@ -165,29 +442,30 @@ class CameraPopoutWindow:
 
         # Scale image to fit while maintaining aspect ratio
         if available_w > 1 and available_h > 1:
-            scaled_img = scale_image_to_fit(pil_img, available_w, available_h)
+            scaled_img = self._scaler.scale(frame, available_w, available_h)
         else:
-            scaled_img = pil_img
+            scaled_img = bgr_frame_to_image(frame)
 
         # Calculate offset for centering (used for coordinate mapping)
         scaled_w, scaled_h = scaled_img.size
         self._video_offset_x = (available_w - scaled_w) // 2
         self._video_offset_y = (available_h - scaled_h) // 2
 
-        # Convert to PhotoImage and display
-        tk_img = ImageTk.PhotoImage(scaled_img)
-        self._disp_img_w = tk_img.width()
-        self._disp_img_h = tk_img.height()
-        self.video_label.imgtk = tk_img
-        self.video_label.configure(image=tk_img)
+        # Paste into the existing PhotoImage when the size is unchanged
+        if self._tk_img is None or self._tk_img_size != scaled_img.size:
+            self._tk_img = ImageTk.PhotoImage(scaled_img)
+            self._tk_img_size = scaled_img.size
+            self.video_label.configure(image=self._tk_img)
+        else:
+            self._tk_img.paste(scaled_img)
+        self._disp_img_w, self._disp_img_h = self._tk_img_size
 
     def _event_to_frame_xy(self, event):
         """Convert mouse event to frame coordinates"""
-        with self.app.frame_lock:
-            frame = self.app.latest_frame_bgr
-            if frame is None:
-                return None
-            fh, fw, _ = frame.shape
+        shape = self.app.frame_shape
+        if shape is None:
+            return None
+        fh, fw = shape
 
         iw = self._disp_img_w or fw
         ih = self._disp_img_h or fh
@@ -201,8 +479,8 @@ class CameraPopoutWindow:
         if not (0 <= x_img < iw and 0 <= y_img < ih):
             return None
 
-        x = int(x_img * fw / iw)
-        y = int(y_img * fh / ih)
+        x = x_img * fw // iw
+        y = y_img * fh // ih
 
         if 0 <= x < fw and 0 <= y < fh:
             return (x, y)
@@ -213,14 +491,15 @@ class CameraPopoutWindow:
         xy = self._event_to_frame_xy(event)
         if xy is None:
             self._last_video_xy = None
-            self.coord_var.set("x: -, y: -")
+            set_var_if_changed(self.coord_var, "x: -, y: -")
             return
         x, y = xy
         self._last_video_xy = (x, y)
-        self.coord_var.set(f"x: {x}, y: {y}")
+        set_var_if_changed(self.coord_var, f"x: {x}, y: {y}")
 
     def _on_video_mouse_leave(self, event):
         """Handle mouse leaving video area"""
+        self._motion.cancel()
         self._last_video_xy = None
         self.coord_var.set("x: -, y: -")
 
@@ -261,13 +540,115 @@ class CameraPopoutWindow:
 
     def close(self):
         """Close the window"""
+        if self._paint_after_id is not None:
+            try:
+                self.window.after_cancel(self._paint_after_id)
+            except Exception:
+                pass
+            self._paint_after_id = None
         try:
             self.window.destroy()
         except:
             pass
 
 
-class RegionSelectorWindow:
+class _FrameRedrawMixin:
+    """
+    Coalesced, rate-limited redraws for camera windows with a window and _update_frame().
+
+    The app calls _on_new_frame from its Tk-thread frame tick whenever a new
+    frame has been published; input handlers call _request_redraw directly.
+    All scheduling happens on the Tk thread.
+    """
+
+    def _init_frame_redraw(self):
+        self.set_max_redraw_hz(DEFAULT_MAX_REDRAW_HZ)
+        self._redraw_after_id = None
+        self._redraw_due = 0.0
+        self._last_paint = 0.0
+        self._frame_listener = self.app.register_frame_listener(self._on_new_frame)
+
+    def _stop_frame_redraw(self):
+        self.app.unregister_frame_listener(self._frame_listener)
+
+    def set_max_redraw_hz(self, hz):
+        """Limit how many times per second the frame and overlay are redrawn."""
+        self.max_redraw_hz = max(1.0, float(hz))
+
+    def _on_new_frame(self):
+        # New frames are never drawn faster than the camera delivers them
+        self._request_redraw(_redraw_interval_ms(self.max_redraw_hz, self.app))
+
+    def _request_redraw(self, interval_ms=None):
+        """
+        Schedule one redraw, no sooner than interval_ms after the last one.
+
+        Input handlers (drag, hover) use the default max_redraw_hz cap so they
+        stay responsive on slow cameras; an earlier request replaces a later one.
+        """
+        if interval_ms is None:
+            interval_ms = _redraw_interval_ms(self.max_redraw_hz)
+        due = self._last_paint + interval_ms / 1000.0
+        if self._redraw_after_id is not None:
+            if due >= self._redraw_due:
+                return
+            self.window.after_cancel(self._redraw_after_id)
+        self._redraw_due = due
+        delay_ms = int((due - time.monotonic()) * 1000)
+        if delay_ms > 0:
+            self._redraw_after_id = self.window.after(delay_ms, self._redraw)
+        else:
+            self._redraw_after_id = self.window.after_idle(self._redraw)
+
+    def _redraw(self):
+        self._redraw_after_id = None
+        if not self.window.winfo_exists():
+            return
+        self._last_paint = time.monotonic()
+        self._update_frame()
+
+
+class _SelectionOverlayMixin:
+    """
+    Selection rectangle with corner handles for windows with a canvas, a
+    current_rect (x, y, w, h) in frame coordinates and _frame_to_canvas().
+    """
+
+    def _init_selection_overlay(self):
+        self._rect_item = self.canvas.create_rectangle(
+            0, 0, 0, 0, outline="#00ff00", width=2, dash=(4, 4), state="hidden", tags="overlay"
+        )
+        self._handle_items = [
+            self.canvas.create_rectangle(
+                0, 0, 0, 0, fill="#00ff00", outline="#ffffff", state="hidden", tags="overlay"
+            )
+            for _ in range(4)
+        ]
+        self._overlay_visible = False
+
+    def _update_overlay(self):
+        """Move the selection rectangle and handles, or hide them if nothing is selected"""
+        if not self.current_rect:
+            if self._overlay_visible:
+                self.canvas.itemconfigure("overlay", state="hidden")
+                self._overlay_visible = False
+            return
+
+        x, y, w, h = self.current_rect
+        # Convert frame coords to canvas coords
+        cx1, cy1 = self._frame_to_canvas(x, y)
+        cx2, cy2 = self._frame_to_canvas(x + w, y + h)
+        self.canvas.coords(self._rect_item, cx1, cy1, cx2, cy2)
+        # Corner handles
+        handle_size = 6
+        for item, (hx, hy) in zip(self._handle_items, [(cx1, cy1), (cx2, cy1), (cx1, cy2), (cx2, cy2)]):
+            self.canvas.coords(item, hx - handle_size, hy - handle_size, hx + handle_size, hy + handle_size)
+        if not self._overlay_visible:
+            self.canvas.itemconfigure("overlay", state="normal")
+            self._overlay_visible = True
+
+
+class RegionSelectorWindow(_FrameRedrawMixin, _SelectionOverlayMixin):
     """
     Window for selecting a region on the camera feed.
     User clicks and drags to draw a rectangle, then confirms the selection.
@@ -317,52 +698,81 @@ class RegionSelectorWindow:
 
         # Bind mouse events
         self.canvas.bind("<ButtonPress-1>", self._on_mouse_down)
-        self.canvas.bind("<B1-Motion>", self._on_mouse_drag)
+        self.canvas.bind("<B1-Motion>", MotionCoalescer(self.window, self._on_mouse_drag))
         self.canvas.bind("<ButtonRelease-1>", self._on_mouse_up)
-        self.canvas.bind("<Motion>", self._on_mouse_move)
+        self.canvas.bind("<Motion>", MotionCoalescer(self.window, self._on_mouse_move))
 
         # Handle window close
         self.window.protocol("WM_DELETE_WINDOW", self._cancel)
 
+        self._scaler = FrameScaler()
+
+        # Canvas size, tracked via <Configure> instead of querying Tk every frame
+        self._canvas_w = 0
+        self._canvas_h = 0
+        self.canvas.bind("<Configure>", self._on_canvas_resize)
+
         # Display size tracking
         self._disp_img_w = 0
         self._disp_img_h = 0
         self._img_offset_x = 0
         self._img_offset_y = 0
+        self._frame_w = 0
+        self._frame_h = 0
 
-        # Start frame updates
+        # Persistent Tk image and canvas item; pixels are pasted in place each tick
+        self._tk_img = None
+        self._tk_img_size = (0, 0)
+        self._img_item = self.canvas.create_image(0, 0, anchor="nw")
+
+        # Selection rectangle and corner handles, moved with coords() and hidden when unused
+        self._init_selection_overlay()
+
+        # What was last drawn; identical state means the redraw can be skipped
+        self._last_drawn_key = None
+
+        # Redraw when a new frame is published rather than polling for it
+        self._init_frame_redraw()
+
+        # Start the watchdog loop (covers canvas resizes and a paused camera)
         self._update_loop()
 
+    def _on_canvas_resize(self, event):
+        self._canvas_w = event.width
+        self._canvas_h = event.height
+
     def _update_loop(self):
-        """Update the display with current frame and selection overlay"""
+        """Periodic safety redraw; new frames and selection changes redraw on demand"""
         if not self.window.winfo_exists():
             return
 
         self._update_frame()
-        self.window.after(30, self._update_loop)
+        self.window.after(_SELECTOR_WATCHDOG_MS, self._update_loop)
 
     def _update_frame(self):
         """Draw current frame with selection rectangle overlay"""
+        # Frames are never modified after being published, so a reference is enough
         with self.app.frame_lock:
             frame = self.app.latest_frame_bgr
-            if frame is None:
-                return
-            frame = frame.copy()
-
-        # Convert BGR to RGB
-        rgb = frame[:, :, ::-1]
-        img = Image.fromarray(rgb)
+            seq = self.app.frame_seq
+        if frame is None:
+            return
 
         # Get canvas size
-        self.canvas.update_idletasks()
-        canvas_w = self.canvas.winfo_width()
-        canvas_h = self.canvas.winfo_height()
+        canvas_w = self._canvas_w
+        canvas_h = self._canvas_h
 
         if canvas_w <= 1 or canvas_h <= 1:
             return
 
+        # Nothing new to show: same frame, same selection, same canvas size
+        draw_key = (seq, self.current_rect, canvas_w, canvas_h)
+        if draw_key == self._last_drawn_key and not self.dragging:
+            return
+        self._last_drawn_key = draw_key
+
         # Scale image to fit
-        scaled_img = scale_image_to_fit(img, canvas_w, canvas_h)
+        scaled_img = self._scaler.scale(frame, canvas_w, canvas_h)
         scaled_w, scaled_h = scaled_img.size
 
         # Calculate offset for centering
@@ -375,42 +785,24 @@ class RegionSelectorWindow:
         self._frame_w = frame.shape[1]
         self._frame_h = frame.shape[0]
 
-        # Convert to PhotoImage
-        tk_img = ImageTk.PhotoImage(scaled_img)
-        self.canvas.imgtk = tk_img
+        # Paste into the existing PhotoImage when the size is unchanged
+        if self._tk_img is None or self._tk_img_size != scaled_img.size:
+            self._tk_img = ImageTk.PhotoImage(scaled_img)
+            self._tk_img_size = scaled_img.size
+            self.canvas.itemconfigure(self._img_item, image=self._tk_img)
+        else:
+            self._tk_img.paste(scaled_img)
+        self.canvas.coords(self._img_item, self._img_offset_x, self._img_offset_y)
 
-        # Clear and redraw
-        self.canvas.delete("all")
-        self.canvas.create_image(
-            self._img_offset_x, self._img_offset_y,
-            anchor="nw", image=tk_img
-        )
-
-        # Draw selection rectangle if we have one
-        if self.current_rect:
-            x, y, w, h = self.current_rect
-            # Convert frame coords to canvas coords
-            cx1, cy1 = self._frame_to_canvas(x, y)
-            cx2, cy2 = self._frame_to_canvas(x + w, y + h)
-            self.canvas.create_rectangle(
-                cx1, cy1, cx2, cy2,
-                outline="#00ff00", width=2, dash=(4, 4)
-            )
-            # Draw corner handles
-            handle_size = 6
-            for hx, hy in [(cx1, cy1), (cx2, cy1), (cx1, cy2), (cx2, cy2)]:
-                self.canvas.create_rectangle(
-                    hx - handle_size, hy - handle_size,
-                    hx + handle_size, hy + handle_size,
-                    fill="#00ff00", outline="#ffffff"
-                )
+        self._update_overlay()
 
     def _frame_to_canvas(self, fx, fy):
         """Convert frame coordinates to canvas coordinates"""
         if self._disp_img_w <= 0 or self._frame_w <= 0:
             return fx, fy
-        cx = self._img_offset_x + int(fx * self._disp_img_w / self._frame_w)
-        cy = self._img_offset_y + int(fy * self._disp_img_h / self._frame_h)
+        # Integer math matches int(a * b / c) for these non-negative sizes, minus the float work
+        cx = self._img_offset_x + fx * self._disp_img_w // self._frame_w
+        cy = self._img_offset_y + fy * self._disp_img_h // self._frame_h
         return cx, cy
 
     def _canvas_to_frame(self, cx, cy):
@@ -427,8 +819,8 @@ class RegionSelectorWindow:
             return None
 
         # Scale to frame coordinates
-        fx = int(ix * self._frame_w / self._disp_img_w)
-        fy = int(iy * self._frame_h / self._disp_img_h)
+        fx = ix * self._frame_w // self._disp_img_w
+        fy = iy * self._frame_h // self._disp_img_h
 
         # Clamp to frame bounds
         fx = max(0, min(fx, self._frame_w - 1))
@@ -445,6 +837,7 @@ class RegionSelectorWindow:
         self.start_x, self.start_y = coords
         self.dragging = True
         self.current_rect = None
+        self._request_redraw()
 
     def _on_mouse_drag(self, event):
         """Update rectangle during drag"""
@@ -468,7 +861,8 @@ class RegionSelectorWindow:
         h = max(1, h)
 
         self.current_rect = (x, y, w, h)
-        self.info_var.set(f"Region: ({x}, {y}) {w}x{h}")
+        set_var_if_changed(self.info_var, f"Region: ({x}, {y}) {w}x{h}")
+        self._request_redraw()
 
     def _on_mouse_up(self, event):
         """Finish rectangle selection"""
@@ -488,20 +882,21 @@ class RegionSelectorWindow:
         coords = self._canvas_to_frame(event.x, event.y)
         if coords is None:
             if not self.current_rect:
-                self.info_var.set("Click and drag to select region")
+                set_var_if_changed(self.info_var, "Click and drag to select region")
             return
 
         fx, fy = coords
         if self.current_rect:
             x, y, w, h = self.current_rect
-            self.info_var.set(f"Region: ({x}, {y}) {w}x{h} | Cursor: ({fx}, {fy})")
+            set_var_if_changed(self.info_var, f"Region: ({x}, {y}) {w}x{h} | Cursor: ({fx}, {fy})")
         else:
-            self.info_var.set(f"Cursor: ({fx}, {fy}) - Click and drag to select")
+            set_var_if_changed(self.info_var, f"Cursor: ({fx}, {fy}) - Click and drag to select")
 
     def _clear(self):
         """Clear the current selection"""
         self.current_rect = None
         self.info_var.set("Click and drag to select region")
+        self._request_redraw()
 
     def _confirm(self):
         """Confirm selection and close"""
@@ -520,12 +915,13 @@ class RegionSelectorWindow:
 
     def _close_window(self):
         """Close the window and call the close callback"""
+        self._stop_frame_redraw()
         self.window.destroy()
         if self.on_close_callback:
             self.on_close_callback()
 
 
-class ColorPickerWindow:
+class ColorPickerWindow(_FrameRedrawMixin):
     """
     Window for picking a color from the camera feed.
     User clicks on a pixel to select its color.
@@ -603,13 +999,21 @@ class ColorPickerWindow:
         ttk.Button(bottom, text="Clear", command=self._clear).pack(side=tk.RIGHT, padx=(0, 6))
 
         # Bind mouse events
-        self.canvas.bind("<Motion>", self._on_mouse_move)
+        self._motion = MotionCoalescer(self.window, self._on_mouse_move)
+        self.canvas.bind("<Motion>", self._motion)
         self.canvas.bind("<Leave>", self._on_mouse_leave)
         self.canvas.bind("<ButtonPress-1>", self._on_click)
 
         # Handle window close
         self.window.protocol("WM_DELETE_WINDOW", self._cancel)
 
+        self._scaler = FrameScaler()
+
+        # Canvas size, tracked via <Configure> instead of querying Tk every frame
+        self._canvas_w = 0
+        self._canvas_h = 0
+        self.canvas.bind("<Configure>", self._on_canvas_resize)
+
         # Display size tracking
         self._disp_img_w = 0
         self._disp_img_h = 0
@@ -618,6 +1022,24 @@ class ColorPickerWindow:
         self._frame_w = 0
         self._frame_h = 0
 
+        # Persistent Tk image, re-created only when the display size changes
+        self._tk_img = None
+        self._tk_img_size = (0, 0)
+        # (frame_seq, canvas_w, canvas_h) of the image currently in _tk_img
+        self._last_image_key = None
+        self._img_item = self.canvas.create_image(0, 0, anchor="nw")
+
+        # Crosshair (vertical line, horizontal line, center circle), moved with coords()
+        self._crosshair_items = (
+            self.canvas.create_line(0, 0, 0, 0, fill="#00ff00", width=2, state="hidden", tags="overlay"),
+            self.canvas.create_line(0, 0, 0, 0, fill="#00ff00", width=2, state="hidden", tags="overlay"),
+            self.canvas.create_oval(0, 0, 0, 0, outline="#00ff00", width=2, state="hidden", tags="overlay"),
+        )
+        self._overlay_visible = False
+
+        # Redraw when a new frame is published rather than polling for it
+        self._init_frame_redraw()
+
         # Initialize with existing selection if provided
         if initial_x is not None and initial_y is not None:
             self._update_selection_from_coords(initial_x, initial_y)
@@ -625,84 +1047,95 @@ class ColorPickerWindow:
         # Start frame updates
         self._update_loop()
 
+    def _on_canvas_resize(self, event):
+        self._canvas_w = event.width
+        self._canvas_h = event.height
+
     def _update_loop(self):
-        """Update the display with current frame"""
+        """Periodic safety redraw; new frames and mouse input redraw on demand"""
         if not self.window.winfo_exists():
             return
 
         self._update_frame()
-        self.window.after(30, self._update_loop)
+        self.window.after(_SELECTOR_WATCHDOG_MS, self._update_loop)
 
     def _update_frame(self):
         """Draw current frame with crosshair on selected point"""
         with self.app.frame_lock:
             frame = self.app.latest_frame_bgr
-            if frame is None:
-                return
-            frame = frame.copy()
+            seq = self.app.frame_seq
+        if frame is None:
+            return
 
         self._frame_w = frame.shape[1]
         self._frame_h = frame.shape[0]
 
-        # Convert BGR to RGB
-        rgb = frame[:, :, ::-1]
-        img = Image.fromarray(rgb)
-
         # Get canvas size
-        self.canvas.update_idletasks()
-        canvas_w = self.canvas.winfo_width()
-        canvas_h = self.canvas.winfo_height()
+        canvas_w = self._canvas_w
+        canvas_h = self._canvas_h
 
         if canvas_w <= 1 or canvas_h <= 1:
             return
 
-        # Scale image to fit
-        scaled_img = scale_image_to_fit(img, canvas_w, canvas_h)
-        scaled_w, scaled_h = scaled_img.size
+        # Same frame at the same canvas size: reuse the last PhotoImage, only the overlay changes
+        image_key = (seq, canvas_w, canvas_h)
+        if image_key != self._last_image_key:
+            self._last_image_key = image_key
 
-        # Calculate offset for centering
-        self._img_offset_x = (canvas_w - scaled_w) // 2
-        self._img_offset_y = (canvas_h - scaled_h) // 2
-        self._disp_img_w = scaled_w
-        self._disp_img_h = scaled_h
+            # Scale image to fit
+            scaled_img = self._scaler.scale(frame, canvas_w, canvas_h)
+            scaled_w, scaled_h = scaled_img.size
 
-        # Convert to PhotoImage
-        tk_img = ImageTk.PhotoImage(scaled_img)
-        self.canvas.imgtk = tk_img
+            # Calculate offset for centering
+            self._img_offset_x = (canvas_w - scaled_w) // 2
+            self._img_offset_y = (canvas_h - scaled_h) // 2
+            self._disp_img_w = scaled_w
+            self._disp_img_h = scaled_h
 
-        # Clear and redraw
-        self.canvas.delete("all")
-        self.canvas.create_image(
-            self._img_offset_x, self._img_offset_y,
-            anchor="nw", image=tk_img
-        )
+            # Paste into the existing PhotoImage when the size is unchanged
+            if self._tk_img is None or self._tk_img_size != scaled_img.size:
+                self._tk_img = ImageTk.PhotoImage(scaled_img)
+                self._tk_img_size = scaled_img.size
+                self.canvas.itemconfigure(self._img_item, image=self._tk_img)
+            else:
+                self._tk_img.paste(scaled_img)
+            self.canvas.coords(self._img_item, self._img_offset_x, self._img_offset_y)
 
-        # Draw crosshair on selected point
-        if self.selected_x is not None and self.selected_y is not None:
-            cx, cy = self._frame_to_canvas(self.selected_x, self.selected_y)
-            line_len = 15
-            # Vertical line
-            self.canvas.create_line(cx, cy - line_len, cx, cy + line_len, fill="#00ff00", width=2)
-            # Horizontal line
-            self.canvas.create_line(cx - line_len, cy, cx + line_len, cy, fill="#00ff00", width=2)
-            # Center circle
-            self.canvas.create_oval(cx - 5, cy - 5, cx + 5, cy + 5, outline="#00ff00", width=2)
+        self._update_overlay()
 
         # Update hover color if we have coordinates
         if self.hover_x is not None and self.hover_y is not None:
             if 0 <= self.hover_x < self._frame_w and 0 <= self.hover_y < self._frame_h:
-                b, g, r = frame[self.hover_y, self.hover_x]
-                self.hover_rgb = (int(r), int(g), int(b))
-                hex_color = f"#{r:02x}{g:02x}{b:02x}"
-                self.hover_swatch.configure(bg=hex_color)
-                self.hover_info_var.set(f"({self.hover_x}, {self.hover_y})\nRGB: {r}, {g}, {b}")
+                b, g, r = frame[self.hover_y, self.hover_x].tolist()
+                self.hover_rgb = (r, g, b)
+                text = f"({self.hover_x}, {self.hover_y})\nRGB: {r}, {g}, {b}"
+                if set_var_if_changed(self.hover_info_var, text):
+                    self.hover_swatch.configure(bg=f"#{r:02x}{g:02x}{b:02x}")
+
+    def _update_overlay(self):
+        """Move the crosshair to the selected point, or hide it if nothing is selected"""
+        if self.selected_x is None or self.selected_y is None:
+            if self._overlay_visible:
+                self.canvas.itemconfigure("overlay", state="hidden")
+                self._overlay_visible = False
+            return
+
+        cx, cy = self._frame_to_canvas(self.selected_x, self.selected_y)
+        line_len = 15
+        vline, hline, circle = self._crosshair_items
+        self.canvas.coords(vline, cx, cy - line_len, cx, cy + line_len)
+        self.canvas.coords(hline, cx - line_len, cy, cx + line_len, cy)
+        self.canvas.coords(circle, cx - 5, cy - 5, cx + 5, cy + 5)
+        if not self._overlay_visible:
+            self.canvas.itemconfigure("overlay", state="normal")
+            self._overlay_visible = True
 
     def _frame_to_canvas(self, fx, fy):
         """Convert frame coordinates to canvas coordinates"""
         if self._disp_img_w <= 0 or self._frame_w <= 0:
             return fx, fy
-        cx = self._img_offset_x + int(fx * self._disp_img_w / self._frame_w)
-        cy = self._img_offset_y + int(fy * self._disp_img_h / self._frame_h)
+        cx = self._img_offset_x + fx * self._disp_img_w // self._frame_w
+        cy = self._img_offset_y + fy * self._disp_img_h // self._frame_h
         return cx, cy
 
     def _canvas_to_frame(self, cx, cy):
@@ -719,8 +1152,8 @@ class ColorPickerWindow:
             return None
 
         # Scale to frame coordinates
-        fx = int(ix * self._frame_w / self._disp_img_w)
-        fy = int(iy * self._frame_h / self._disp_img_h)
+        fx = ix * self._frame_w // self._disp_img_w
+        fy = iy * self._frame_h // self._disp_img_h
 
         # Clamp to frame bounds
         fx = max(0, min(fx, self._frame_w - 1))
@@ -734,14 +1167,16 @@ class ColorPickerWindow:
         if coords is None:
             self.hover_x = None
             self.hover_y = None
-            self.hover_info_var.set("Move cursor over image")
+            set_var_if_changed(self.hover_info_var, "Move cursor over image")
             self.hover_swatch.configure(bg="#808080")
             return
 
         self.hover_x, self.hover_y = coords
+        self._request_redraw()
 
     def _on_mouse_leave(self, event):
         """Clear hover info"""
+        self._motion.cancel()
         self.hover_x = None
         self.hover_y = None
         self.hover_info_var.set("Move cursor over image")
@@ -759,17 +1194,18 @@ class ColorPickerWindow:
         """Update selection based on coordinates"""
         self.selected_x = x
         self.selected_y = y
+        self._request_redraw()
 
-        # Get color from current frame
+        # Get color from current frame; only the reference read needs the lock
         with self.app.frame_lock:
             frame = self.app.latest_frame_bgr
-            if frame is not None and 0 <= y < frame.shape[0] and 0 <= x < frame.shape[1]:
-                b, g, r = frame[y, x]
-                self.selected_rgb = (int(r), int(g), int(b))
-                hex_color = f"#{r:02x}{g:02x}{b:02x}"
-                self.selected_swatch.configure(bg=hex_color)
-                self.selected_info_var.set(f"({x}, {y})\nRGB: {r}, {g}, {b}")
-                self.info_var.set(f"Selected: ({x}, {y}) RGB({r}, {g}, {b}) - Click Confirm to use")
+        if frame is not None and 0 <= y < frame.shape[0] and 0 <= x < frame.shape[1]:
+            b, g, r = frame[y, x].tolist()
+            self.selected_rgb = (r, g, b)
+            hex_color = f"#{r:02x}{g:02x}{b:02x}"
+            self.selected_swatch.configure(bg=hex_color)
+            self.selected_info_var.set(f"({x}, {y})\nRGB: {r}, {g}, {b}")
+            self.info_var.set(f"Selected: ({x}, {y}) RGB({r}, {g}, {b}) - Click Confirm to use")
 
     def _clear(self):
         """Clear the current selection"""
@@ -779,6 +1215,7 @@ class ColorPickerWindow:
         self.selected_swatch.configure(bg="#808080")
         self.selected_info_var.set("Click to select")
         self.info_var.set("Click on camera to pick a color")
+        self._request_redraw()
 
     def _confirm(self):
         """Confirm selection and close"""
@@ -797,12 +1234,13 @@ class ColorPickerWindow:
 
     def _close_window(self):
         """Close the window and call the close callback"""
+        self._stop_frame_redraw()
         self.window.destroy()
         if self.on_close_callback:
             self.on_close_callback()
 
 
-class AreaColorPickerWindow:
+class AreaColorPickerWindow(_FrameRedrawMixin, _SelectionOverlayMixin):
     """
     Window for selecting an area and picking its average color from the camera feed.
     Combines region selection with color detection - shows average color of selected area.
@@ -889,13 +1327,20 @@ class AreaColorPickerWindow:
 
         # Bind mouse events
         self.canvas.bind("<ButtonPress-1>", self._on_mouse_down)
-        self.canvas.bind("<B1-Motion>", self._on_mouse_drag)
+        self.canvas.bind("<B1-Motion>", MotionCoalescer(self.window, self._on_mouse_drag))
         self.canvas.bind("<ButtonRelease-1>", self._on_mouse_up)
-        self.canvas.bind("<Motion>", self._on_mouse_move)
+        self.canvas.bind("<Motion>", MotionCoalescer(self.window, self._on_mouse_move))
 
         # Handle window close
         self.window.protocol("WM_DELETE_WINDOW", self._cancel)
 
+        self._scaler = FrameScaler()
+
+        # Canvas size, tracked via <Configure> instead of querying Tk every frame
+        self._canvas_w = 0
+        self._canvas_h = 0
+        self.canvas.bind("<Configure>", self._on_canvas_resize)
+
         # Display size tracking
         self._disp_img_w = 0
         self._disp_img_h = 0
@@ -904,82 +1349,87 @@ class AreaColorPickerWindow:
         self._frame_w = 0
         self._frame_h = 0
 
+        # Persistent Tk image, re-created only when the display size changes
+        self._tk_img = None
+        self._tk_img_size = (0, 0)
+        # (frame_seq, canvas_w, canvas_h) of the image currently in _tk_img
+        self._last_image_key = None
+        # (frame_seq, current_rect) the displayed average color was computed for
+        self._last_avg_key = None
+        self._img_item = self.canvas.create_image(0, 0, anchor="nw")
+
+        # Selection rectangle and corner handles, moved with coords() and hidden when unused
+        self._init_selection_overlay()
+
+        # Redraw when a new frame is published rather than polling for it
+        self._init_frame_redraw()
+
         # Start frame updates
         self._update_loop()
 
+    def _on_canvas_resize(self, event):
+        self._canvas_w = event.width
+        self._canvas_h = event.height
+
     def _update_loop(self):
-        """Update the display with current frame and selection overlay"""
+        """Periodic safety redraw; new frames and mouse input redraw on demand"""
         if not self.window.winfo_exists():
             return
 
         self._update_frame()
-        self.window.after(30, self._update_loop)
+        self.window.after(_SELECTOR_WATCHDOG_MS, self._update_loop)
 
     def _update_frame(self):
         """Draw current frame with selection rectangle overlay and calculate average color"""
         with self.app.frame_lock:
             frame = self.app.latest_frame_bgr
-            if frame is None:
-                return
-            frame = frame.copy()
+            seq = self.app.frame_seq
+        if frame is None:
+            return
 
         self._frame_w = frame.shape[1]
         self._frame_h = frame.shape[0]
 
-        # Convert BGR to RGB
-        rgb = frame[:, :, ::-1]
-        img = Image.fromarray(rgb)
-
         # Get canvas size
-        self.canvas.update_idletasks()
-        canvas_w = self.canvas.winfo_width()
-        canvas_h = self.canvas.winfo_height()
+        canvas_w = self._canvas_w
+        canvas_h = self._canvas_h
 
         if canvas_w <= 1 or canvas_h <= 1:
             return
 
-        # Scale image to fit
-        scaled_img = scale_image_to_fit(img, canvas_w, canvas_h)
-        scaled_w, scaled_h = scaled_img.size
-
-        # Calculate offset for centering
-        self._img_offset_x = (canvas_w - scaled_w) // 2
-        self._img_offset_y = (canvas_h - scaled_h) // 2
-        self._disp_img_w = scaled_w
-        self._disp_img_h = scaled_h
-
-        # Convert to PhotoImage
-        tk_img = ImageTk.PhotoImage(scaled_img)
-        self.canvas.imgtk = tk_img
-
-        # Clear and redraw
-        self.canvas.delete("all")
-        self.canvas.create_image(
-            self._img_offset_x, self._img_offset_y,
-            anchor="nw", image=tk_img
-        )
-
-        # Draw selection rectangle if we have one
+        # Same frame at the same canvas size: reuse the last PhotoImage, only the overlay changes
+        image_key = (seq, canvas_w, canvas_h)
+        if image_key != self._last_image_key:
+            self._last_image_key = image_key
+
+            # Scale image to fit
+            scaled_img = self._scaler.scale(frame, canvas_w, canvas_h)
+            scaled_w, scaled_h = scaled_img.size
+
+            # Calculate offset for centering
+            self._img_offset_x = (canvas_w - scaled_w) // 2
+            self._img_offset_y = (canvas_h - scaled_h) // 2
+            self._disp_img_w = scaled_w
+            self._disp_img_h = scaled_h
+
+            # Paste into the existing PhotoImage when the size is unchanged
+            if self._tk_img is None or self._tk_img_size != scaled_img.size:
+                self._tk_img = ImageTk.PhotoImage(scaled_img)
+                self._tk_img_size = scaled_img.size
+                self.canvas.itemconfigure(self._img_item, image=self._tk_img)
+            else:
+                self._tk_img.paste(scaled_img)
+            self.canvas.coords(self._img_item, self._img_offset_x, self._img_offset_y)
+
+        self._update_overlay()
+
+        # Calculate and display average color for selected region (same frame and region: unchanged)
         if self.current_rect:
-            x, y, w, h = self.current_rect
-            # Convert frame coords to canvas coords
-            cx1, cy1 = self._frame_to_canvas(x, y)
-            cx2, cy2 = self._frame_to_canvas(x + w, y + h)
-            self.canvas.create_rectangle(
-                cx1, cy1, cx2, cy2,
-                outline="#00ff00", width=2, dash=(4, 4)
-            )
-            # Draw corner handles
-            handle_size = 6
-            for hx, hy in [(cx1, cy1), (cx2, cy1), (cx1, cy2), (cx2, cy2)]:
-                self.canvas.create_rectangle(
-                    hx - handle_size, hy - handle_size,
-                    hx + handle_size, hy + handle_size,
-                    fill="#00ff00", outline="#ffffff"
-                )
-
-            # Calculate and display average color for selected region
-            self._update_avg_color(frame, x, y, w, h)
+            avg_key = (seq, self.current_rect)
+            if avg_key != self._last_avg_key:
+                self._last_avg_key = avg_key
+                x, y, w, h = self.current_rect
+                self._update_avg_color(frame, x, y, w, h)
 
     def _update_avg_color(self, frame, x, y, w, h):
         """Calculate and display the average color of the selected region."""
@@ -994,22 +1444,18 @@ class AreaColorPickerWindow:
 
         if region_bgr.size == 0:
             self.avg_rgb = None
-            self.avg_swatch.configure(bg="#808080")
-            self.avg_info_var.set("Region is empty")
+            if set_var_if_changed(self.avg_info_var, "Region is empty"):
+                self.avg_swatch.configure(bg="#808080")
             return
 
         # Calculate average color
-        avg_b = float(np.mean(region_bgr[:, :, 0]))
-        avg_g = float(np.mean(region_bgr[:, :, 1]))
-        avg_r = float(np.mean(region_bgr[:, :, 2]))
-
-        self.avg_rgb = (int(avg_r), int(avg_g), int(avg_b))
+        self.avg_rgb = mean_bgr_int(region_bgr)
         r, g, b = self.avg_rgb
 
-        # Update swatch
-        hex_color = f"#{r:02x}{g:02x}{b:02x}"
-        self.avg_swatch.configure(bg=hex_color)
-        self.avg_info_var.set(f"Region: ({x},{y}) {w}x{h}\nAvg RGB: {r}, {g}, {b}")
+        # Update swatch (only when the text, and so the color, changed)
+        text = f"Region: ({x},{y}) {w}x{h}\nAvg RGB: {r}, {g}, {b}"
+        if set_var_if_changed(self.avg_info_var, text):
+            self.avg_swatch.configure(bg=f"#{r:02x}{g:02x}{b:02x}")
 
     def _update_target_swatch(self):
         """Update the target color swatch."""
@@ -1032,8 +1478,8 @@ class AreaColorPickerWindow:
         """Convert frame coordinates to canvas coordinates"""
         if self._disp_img_w <= 0 or self._frame_w <= 0:
             return fx, fy
-        cx = self._img_offset_x + int(fx * self._disp_img_w / self._frame_w)
-        cy = self._img_offset_y + int(fy * self._disp_img_h / self._frame_h)
+        cx = self._img_offset_x + fx * self._disp_img_w // self._frame_w
+        cy = self._img_offset_y + fy * self._disp_img_h // self._frame_h
         return cx, cy
 
     def _canvas_to_frame(self, cx, cy):
@@ -1050,8 +1496,8 @@ class AreaColorPickerWindow:
             return None
 
         # Scale to frame coordinates
-        fx = int(ix * self._frame_w / self._disp_img_w)
-        fy = int(iy * self._frame_h / self._disp_img_h)
+        fx = ix * self._frame_w // self._disp_img_w
+        fy = iy * self._frame_h // self._disp_img_h
 
         # Clamp to frame bounds
         fx = max(0, min(fx, self._frame_w - 1))
@@ -1068,6 +1514,7 @@ class AreaColorPickerWindow:
         self.start_x, self.start_y = coords
         self.dragging = True
         self.current_rect = None
+        self._request_redraw()
 
     def _on_mouse_drag(self, event):
         """Update rectangle during drag"""
@@ -1091,7 +1538,8 @@ class AreaColorPickerWindow:
         h = max(1, h)
 
         self.current_rect = (x, y, w, h)
-        self.info_var.set(f"Region: ({x}, {y}) {w}x{h}")
+        set_var_if_changed(self.info_var, f"Region: ({x}, {y}) {w}x{h}")
+        self._request_redraw()
 
     def _on_mouse_up(self, event):
         """Finish rectangle selection"""
@@ -1111,23 +1559,25 @@ class AreaColorPickerWindow:
         coords = self._canvas_to_frame(event.x, event.y)
         if coords is None:
             if not self.current_rect:
-                self.info_var.set("Click and drag to select region")
+                set_var_if_changed(self.info_var, "Click and drag to select region")
             return
 
         fx, fy = coords
         if self.current_rect:
             x, y, w, h = self.current_rect
-            self.info_var.set(f"Region: ({x}, {y}) {w}x{h} | Cursor: ({fx}, {fy})")
+            set_var_if_changed(self.info_var, f"Region: ({x}, {y}) {w}x{h} | Cursor: ({fx}, {fy})")
         else:
-            self.info_var.set(f"Cursor: ({fx}, {fy}) - Click and drag to select")
+            set_var_if_changed(self.info_var, f"Cursor: ({fx}, {fy}) - Click and drag to select")
 
     def _clear(self):
         """Clear the current selection"""
         self.current_rect = None
         self.avg_rgb = None
+        self._last_avg_key = None
         self.avg_swatch.configure(bg="#808080")
         self.avg_info_var.set("Select an area to see average color")
         self.info_var.set("Click and drag to select region")
+        self._request_redraw()
 
     def _confirm(self):
         """Confirm selection and close"""
@@ -1148,6 +1598,7 @@ class AreaColorPickerWindow:
 
     def _close_window(self):
         """Close the window and call the close callback"""
+        self._stop_frame_redraw()
         self.window.destroy()
         if self.on_close_callback:
             self.on_close_callback()
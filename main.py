@@ -21,7 +21,7 @@ import tkinter as tk
 import copy
 from tkinter import ttk, messagebox, filedialog, simpledialog
 import numpy as np
-from PIL import Image, ImageTk
+from PIL import ImageTk
 
 from typing import Optional
 
@@ -32,6 +32,8 @@ import ScriptEngine
 import ScriptToPy
 from utils import (
     ffmpeg_path,
+    bgr_frame_to_image,
+    mean_bgr_int,
     safe_script_filename,
     list_script_files,
     list_com_ports,
@@ -52,7 +54,9 @@ from utils import (
 )
 from camera import (
     list_dshow_video_devices,
-    scale_image_to_fit,
+    FrameScaler,
+    MotionCoalescer,
+    set_var_if_changed,
     CameraPopoutWindow,
     RegionSelectorWindow,
     ColorPickerWindow,
@@ -67,6 +71,9 @@ from dialogs import CommandEditorDialog, SettingsDialog, PythonDownloadDialog, D
 # Windows-specific flag to hide console window for subprocesses
 _SUBPROCESS_FLAGS = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
 
+# Smoothing factor for the measured camera_fps (weight of the newest 1/dt sample)
+CAMERA_FPS_EMA_ALPHA = 0.1
+
 THEME_COLORS = {
     "light": {
         "bg": "#f4f5f7",
@@ -220,13 +227,34 @@ class App:
         self.cam_fps = 30
         self.cam_proc = None
         self.cam_thread = None
+        self._cam_refresh_running = False
+        self._cam_refresh_force_pending = False
+        self._cam_list_queue = queue.Queue()
         self.cam_running = False
         self.frame_lock = threading.Lock()
         self.latest_frame_bgr = None
+        # (height, width) of latest_frame_bgr, or None; read without frame_lock by UI handlers
+        self.frame_shape = None
+        # Incremented for every published frame so viewers can skip unchanged redraws
+        self.frame_seq = 0
+        # Measured capture rate (EMA of 1/dt between frames); viewers pace their polling by it
+        self.camera_fps = float(self.cam_fps)
+        # Callbacks run on the Tk thread when frame_seq advances (tuple, replaced on change)
+        self._frame_listeners = ()
+        self._notified_frame_seq = 0
         self.video_mouse_xy_var = tk.StringVar(value="x: -, y: -")
         self._last_video_xy = None  # (x,y) in frame coords or None
         self._disp_img_w = 0
         self._disp_img_h = 0
+        # Persistent PhotoImage for the embedded preview (the only reference to it)
+        self._video_tk_img = None
+        self._video_tk_img_size = (0, 0)
+        self._video_scaler = FrameScaler()
+        # Preview label size, tracked via <Configure> instead of querying Tk every frame
+        self._video_avail_w = 0
+        self._video_avail_h = 0
+        # (frame_seq, width, height) last drawn into _video_tk_img
+        self._video_drawn_key = None
         self.camera_panel_hidden = True
         self._saved_sash_x = None
         self.base_video_width = 640  # adjust if you want
@@ -1058,9 +1086,25 @@ class App:
         self.root.after(0, show_dialog)
 
     # ---- frame access
-    def get_latest_frame(self):
+    def get_latest_frame(self, copy=True):
+        # Only the reference read needs the lock; published frames are never mutated.
+        # copy=False returns the shared read-only array for callers that only read it.
         with self.frame_lock:
-            return None if self.latest_frame_bgr is None else self.latest_frame_bgr.copy()
+            frame = self.latest_frame_bgr
+        if frame is None or not copy:
+            return frame
+        return frame.copy()
+
+    def register_frame_listener(self, cb):
+        """
+        Call cb() on the Tk thread, from the frame update tick, once per newly published frame.
+        Returns a token for unregister_frame_listener.
+        """
+        self._frame_listeners = self._frame_listeners + (cb,)
+        return cb
+
+    def unregister_frame_listener(self, token):
+        self._frame_listeners = tuple(cb for cb in self._frame_listeners if cb is not token)
 
     # ---- UI build
     def _build_ui(self):
@@ -1094,7 +1138,7 @@ class App:
         self.cam_combo = ttk.Combobox(top, textvariable=self.cam_var, state="readonly", width=16)
         self.cam_combo.grid(row=0, column=1, sticky="w", padx=(6, 6))
         self.cam_combo.bind("<<ComboboxSelected>>", self._on_camera_selected)
-        ttk.Button(top, text="Refresh", command=self.refresh_cameras).grid(row=0, column=2, padx=(0, 0))
+        ttk.Button(top, text="Refresh", command=lambda: self.refresh_cameras(force=True)).grid(row=0, column=2, padx=(0, 0))
         self.cam_toggle_btn = ttk.Button(top, text="Start Cam", command=self.toggle_camera)
         self.cam_toggle_btn.grid(row=0, column=3, padx=(0, 6))
 
@@ -1191,10 +1235,12 @@ class App:
         self.video_label = ttk.Label(left,anchor="nw")
         self.video_label.grid(row=0, column=0, sticky="nsew")
 
-        self.video_label.bind("<Motion>", self._on_video_mouse_move)
+        self._video_motion = MotionCoalescer(self.video_label, self._on_video_mouse_move)
+        self.video_label.bind("<Motion>", self._video_motion)
         self.video_label.bind("<Leave>", self._on_video_mouse_leave)
         self.video_label.bind("<Button-1>", self._on_video_click)
         self.video_label.bind("<Double-Button-1>", self._on_video_double_click)
+        self.video_label.bind("<Configure>", self._on_video_label_resize)
 
 
         # Coordinate readout
@@ -1212,7 +1258,7 @@ class App:
         self.audio_input_combo = ttk.Combobox(self.audio_input_frame, textvariable=self.audio_input_var, state="readonly", width=30)
         self.audio_input_combo.grid(row=0, column=1, sticky="ew", padx=(0, 6))
         self.audio_input_combo.bind("<<ComboboxSelected>>", self._on_audio_input_selected)
-        ttk.Button(self.audio_input_frame, text="Refresh", command=self.refresh_audio_devices).grid(row=0, column=2, padx=(0, 6))
+        ttk.Button(self.audio_input_frame, text="Refresh", command=lambda: self.refresh_audio_devices(force=True)).grid(row=0, column=2, padx=(0, 6))
         self.audio_toggle_btn = ttk.Button(self.audio_input_frame, text="Start Audio", command=self.toggle_audio)
         self.audio_toggle_btn.grid(row=0, column=3)
 
@@ -1678,11 +1724,10 @@ class App:
 
 
     def _event_to_frame_xy(self, event):
-        with self.frame_lock:
-            frame = self.latest_frame_bgr
-            if frame is None:
-                return None
-            fh, fw, _ = frame.shape
+        shape = self.frame_shape
+        if shape is None:
+            return None
+        fh, fw = shape
 
         iw = getattr(self, "_disp_img_w", fw) or fw
         ih = getattr(self, "_disp_img_h", fh) or fh
@@ -1697,8 +1742,8 @@ class App:
             return None
 
         # If later you scale the image, this keeps working:
-        x = int(x_img * fw / iw)
-        y = int(y_img * fh / ih)
+        x = x_img * fw // iw
+        y = y_img * fh // ih
 
         if 0 <= x < fw and 0 <= y < fh:
             return (x, y)
@@ -1836,7 +1881,12 @@ class App:
         self.script_text.tag_add("selected", line_start, line_end)
         self.selected_script_line = idx
 
+    def _on_video_label_resize(self, event):
+        self._video_avail_w = event.width
+        self._video_avail_h = event.height
+
     def _on_video_mouse_leave(self, event):
+        self._video_motion.cancel()
         self._last_video_xy = None
         self.video_mouse_xy_var.set("x: -, y: -")
 
@@ -1844,11 +1894,11 @@ class App:
         xy = self._event_to_frame_xy(event)
         if xy is None:
             self._last_video_xy = None
-            self.video_mouse_xy_var.set("x: -, y: -")
+            set_var_if_changed(self.video_mouse_xy_var, "x: -, y: -")
             return
         x, y = xy
         self._last_video_xy = (x, y)
-        self.video_mouse_xy_var.set(f"x: {x}, y: {y}")
+        set_var_if_changed(self.video_mouse_xy_var, f"x: {x}, y: {y}")
 
     def _on_video_double_click(self, event):
         """Double-click to pop out camera window"""
@@ -1868,7 +1918,7 @@ class App:
 
         # Hide main video display (keep label but clear image)
         self.video_label.configure(image="")
-        self.video_label.imgtk = None
+        self._video_tk_img = None
 
     def _on_popout_close(self):
         """Handle popout window closing - return to embedded mode"""
@@ -1902,8 +1952,43 @@ class App:
 
 
     # ---- camera
-    def refresh_cameras(self):
-        cams = list_dshow_video_devices()
+    def refresh_cameras(self, force=False):
+        # Listing spawns ffmpeg; do it off the Tk thread and fill the combo when done
+        if self._cam_refresh_running:
+            # Re-run a forced refresh once the pending one lands
+            self._cam_refresh_force_pending = self._cam_refresh_force_pending or force
+            return
+        self._cam_refresh_running = True
+
+        def worker():
+            cams = []
+            try:
+                cams = list_dshow_video_devices(force=force)
+            except Exception:
+                pass
+            finally:
+                self._cam_list_queue.put(cams)
+
+        threading.Thread(target=worker, daemon=True).start()
+        self.root.after(self._status_poll_ms, self._drain_camera_list_queue)
+
+    def _drain_camera_list_queue(self):
+        if not self.root.winfo_exists():
+            return
+        try:
+            cams = self._cam_list_queue.get_nowait()
+        except queue.Empty:
+            self.root.after(self._status_poll_ms, self._drain_camera_list_queue)
+            return
+        try:
+            self._apply_camera_list(cams)
+        finally:
+            self._cam_refresh_running = False
+        if self._cam_refresh_force_pending:
+            self._cam_refresh_force_pending = False
+            self.refresh_cameras(force=True)
+
+    def _apply_camera_list(self, cams):
         self.cam_combo["values"] = cams
         current = self.cam_var.get().strip()
         saved = (self._settings.get("default_camera_device") or "").strip()
@@ -1976,6 +2061,7 @@ class App:
         self.cam_proc = None
         with self.frame_lock:
             self.latest_frame_bgr = None
+            self.frame_shape = None
 
         # Close popout window if open
         if self.popout_window is not None:
@@ -2123,6 +2209,9 @@ class App:
         if not self.cam_proc or not self.cam_proc.stdout:
             return
         frame_size = self.cam_width * self.cam_height * 3
+        frame_shape = (self.cam_height, self.cam_width)
+        self.camera_fps = float(self.cam_fps)
+        last_t = None
         while self.cam_running and self.cam_proc and self.cam_proc.stdout:
             try:
                 raw = self.cam_proc.stdout.read(frame_size)
@@ -2133,8 +2222,17 @@ class App:
                     # Incomplete frame, skip it
                     continue
                 frame = np.frombuffer(raw, dtype=np.uint8).reshape((self.cam_height, self.cam_width, 3))
+                # Each frame is a new array that is never modified after publishing,
+                # so readers may hold a reference without frame_lock or a copy.
+                # Viewers convert to RGB only after downscaling (see FrameScaler).
                 with self.frame_lock:
                     self.latest_frame_bgr = frame
+                    self.frame_shape = frame_shape
+                    self.frame_seq += 1
+                now = time.perf_counter()
+                if last_t is not None and now > last_t:
+                    self.camera_fps += (1.0 / (now - last_t) - self.camera_fps) * CAMERA_FPS_EMA_ALPHA
+                last_t = now
             except Exception:
                 # Handle any read errors (broken pipe, etc.)
                 break
@@ -2145,25 +2243,37 @@ class App:
 
     def _schedule_frame_update(self):
         self._update_video_frame()
+        self._notify_frame_listeners()
         self.root.after(15, self._schedule_frame_update)
 
+    def _notify_frame_listeners(self):
+        # Runs on the Tk thread; the capture thread only bumps frame_seq
+        seq = self.frame_seq
+        if seq == self._notified_frame_seq:
+            return
+        self._notified_frame_seq = seq
+        for cb in self._frame_listeners:
+            try:
+                cb()
+            except Exception:
+                pass
+
     def _update_video_frame(self):
+        # Published frames are never modified in place, so a reference is enough
         with self.frame_lock:
-            frame = None if self.latest_frame_bgr is None else self.latest_frame_bgr.copy()
+            frame = self.latest_frame_bgr
+            seq = self.frame_seq
         if frame is None:
             return
-        rgb = frame[:, :, ::-1]
-        img = Image.fromarray(rgb)
 
         # Route to popout window if active, otherwise to main window
         if self.popout_window is not None:
             # Update popout window with PIL image (it does its own scaling)
-            self.popout_window.update_frame(img)
+            self.popout_window.update_frame(frame, seq)
         else:
             # Update main window - scale to fit available space
-            self.video_label.update_idletasks()
-            available_w = self.video_label.winfo_width()
-            available_h = self.video_label.winfo_height()
+            available_w = self._video_avail_w
+            available_h = self._video_avail_h
 
             # Fallback: if label not yet sized, try to get size from main pane
             if available_w <= 1 or available_h <= 1:
@@ -2180,20 +2290,29 @@ class App:
                 except Exception:
                     pass
 
+            # Same frame at the same size is already on screen
+            draw_key = (seq, available_w, available_h)
+            if self._video_tk_img is not None and draw_key == self._video_drawn_key:
+                return
+            self._video_drawn_key = draw_key
+
             # Scale if we have valid dimensions, otherwise show at native size
             if available_w > 1 and available_h > 1:
-                scaled_img = scale_image_to_fit(img, available_w, available_h)
+                scaled_img = self._video_scaler.scale(frame, available_w, available_h)
             else:
-                scaled_img = img
+                scaled_img = bgr_frame_to_image(frame)
 
-            tk_img = ImageTk.PhotoImage(scaled_img)
-            self._disp_img_w = tk_img.width()
-            self._disp_img_h = tk_img.height()
-            self.video_label.imgtk = tk_img
-            self.video_label.configure(image=tk_img)
+            # Paste into the existing PhotoImage; only (re)attach it when the size changes
+            if self._video_tk_img is None or self._video_tk_img_size != scaled_img.size:
+                self._video_tk_img = ImageTk.PhotoImage(scaled_img)
+                self._video_tk_img_size = scaled_img.size
+                self.video_label.configure(image=self._video_tk_img)
+            else:
+                self._video_tk_img.paste(scaled_img)
+            self._disp_img_w, self._disp_img_h = self._video_tk_img_size
 
     # ---- audio
-    def refresh_audio_devices(self):
+    def refresh_audio_devices(self, force=False):
         if not PYAUDIO_AVAILABLE:
             self.audio_input_combo["values"] = ["PyAudio not installed"]
             self.audio_output_combo["values"] = ["PyAudio not installed"]
@@ -2203,7 +2322,7 @@ class App:
                 self.audio_toggle_btn.configure(state="disabled")
             return
 
-        inputs, outputs = list_audio_devices()
+        inputs, outputs = list_audio_devices(force=force)
         self.audio_input_devices = inputs
         self.audio_output_devices = outputs
 
@@ -2565,6 +2684,8 @@ class App:
 
     # ---- serial
     def refresh_ports(self):
+        # Refresh is also how users recover from a wrong backend detection
+        self.serial.clear_probe_cache()
         ports = list_com_ports()
         self.com_combo["values"] = ports
         current = self.com_var.get().strip()
@@ -3467,7 +3588,7 @@ class App:
         cmd = cmd_obj.get("cmd")
         match cmd:
             case "find_color":
-                frame = self.get_latest_frame()
+                frame = self.get_latest_frame(copy=False)
                 if frame is None:
                     return ("find_color Test", "No camera frame available.\nStart the camera first.")
 
@@ -3517,7 +3638,7 @@ class App:
                 return ("find_color Test", msg)
 
             case "find_area_color":
-                frame = self.get_latest_frame()
+                frame = self.get_latest_frame(copy=False)
                 if frame is None:
                     return ("find_area_color Test", "No camera frame available.\nStart the camera first.")
 
@@ -3552,11 +3673,7 @@ class App:
                     return ("find_area_color Test", "Region is empty (size is 0).")
 
                 # Calculate average color
-                avg_b = float(np.mean(region_bgr[:, :, 0]))
-                avg_g = float(np.mean(region_bgr[:, :, 1]))
-                avg_r = float(np.mean(region_bgr[:, :, 2]))
-
-                avg_rgb = (int(avg_r), int(avg_g), int(avg_b))
+                avg_rgb = mean_bgr_int(region_bgr)
                 target = (int(rgb[0]), int(rgb[1]), int(rgb[2]))
 
                 # Calculate CIE76 Delta E
@@ -3590,7 +3707,7 @@ class App:
                 return ("find_area_color Test", msg)
 
             case "wait_for_color":
-                frame = self.get_latest_frame()
+                frame = self.get_latest_frame(copy=False)
                 if frame is None:
                     return ("wait_for_color Test", "No camera frame available.\nStart the camera first.")
 
@@ -3652,7 +3769,7 @@ class App:
                 return ("wait_for_color Test", msg)
 
             case "wait_for_color_area":
-                frame = self.get_latest_frame()
+                frame = self.get_latest_frame(copy=False)
                 if frame is None:
                     return ("wait_for_color_area Test", "No camera frame available.\nStart the camera first.")
 
@@ -3690,11 +3807,7 @@ class App:
                     return ("wait_for_color_area Test", "Region is empty (size is 0).")
 
                 # Calculate average color
-                avg_b = float(np.mean(region_bgr[:, :, 0]))
-                avg_g = float(np.mean(region_bgr[:, :, 1]))
-                avg_r = float(np.mean(region_bgr[:, :, 2]))
-
-                avg_rgb = (int(avg_r), int(avg_g), int(avg_b))
+                avg_rgb = mean_bgr_int(region_bgr)
                 target = (int(rgb[0]), int(rgb[1]), int(rgb[2]))
 
                 # Calculate CIE76 Delta E
@@ -3746,7 +3859,7 @@ class App:
                             "  Windows: https://github.com/UB-Mannheim/tesseract/wiki\n"
                             "  Linux: sudo apt install tesseract-ocr")
 
-                frame = self.get_latest_frame()
+                frame = self.get_latest_frame(copy=False)
                 if frame is None:
                     return ("read_text Test", "No camera frame available.\nStart the camera first.")
 
@@ -4,6 +4,11 @@ Utility functions for Controller Macro Runner.
 import os
 import sys
 import re
+import threading
+import time
+
+import numpy as np
+from PIL import Image
 
 
 def resource_path(rel_path: str) -> str:
@@ -106,6 +111,145 @@ def find_sound_file(filename: str) -> str | None:
     return None
 
 
+# ----------------------------
+# High-Precision Timing
+# ----------------------------
+
+# Final stretch of precise_sleep() that is busy-waited. Windows high-resolution
+# timers can overshoot by ~0.5ms, so keep a wider margin there.
+_SPIN_TAIL_S = 0.001 if sys.platform == "win32" else 0.0002
+
+# Longest uninterrupted block in precise_sleep_interruptible(), i.e. how late a stop can be seen.
+_STOP_POLL_S = 0.005
+
+
+class _WinHrTimer:
+    """Owns one waitable timer handle; closed when the owning thread's locals are freed."""
+
+    __slots__ = ("handle",)
+
+    def __init__(self):
+        self.handle = None
+        try:
+            import ctypes
+            CREATE_WAITABLE_TIMER_HIGH_RESOLUTION = 0x00000002
+            TIMER_ALL_ACCESS = 0x1F0003
+            self.handle = ctypes.windll.kernel32.CreateWaitableTimerExW(
+                None, None, CREATE_WAITABLE_TIMER_HIGH_RESOLUTION, TIMER_ALL_ACCESS
+            ) or None
+        except Exception:
+            self.handle = None
+
+    def __del__(self):
+        handle, self.handle = self.handle, None
+        if handle:
+            try:
+                import ctypes
+                ctypes.windll.kernel32.CloseHandle(handle)
+            except Exception:
+                pass
+
+
+_hr_timer_local = threading.local()
+
+
+def _win_hr_timer():
+    """Per-thread high-resolution waitable timer handle, or None if unsupported."""
+    timer = getattr(_hr_timer_local, "timer", None)
+    if timer is None:
+        timer = _hr_timer_local.timer = _WinHrTimer()
+    return timer.handle
+
+
+def _coarse_sleep(duration_sec):
+    """
+    Block the thread without spinning.
+
+    Python 3.11+ already sleeps on a high-resolution timer (waitable timer on
+    Windows, clock_nanosleep elsewhere). Older Windows builds get ~15ms
+    granularity from time.sleep(), so use a waitable timer there directly.
+    """
+    if sys.platform == "win32" and sys.version_info < (3, 11):
+        handle = _win_hr_timer()
+        if handle:
+            import ctypes
+            due = ctypes.c_longlong(-int(duration_sec * 10_000_000))  # relative, 100ns units
+            kernel32 = ctypes.windll.kernel32
+            if kernel32.SetWaitableTimer(handle, ctypes.byref(due), 0, None, None, False):
+                kernel32.WaitForSingleObject(handle, 0xFFFFFFFF)
+                return
+    time.sleep(duration_sec)
+
+
+def precise_sleep(duration_sec):
+    """
+    High-precision sleep: block on a high-resolution timer, then busy-wait
+    only the last fraction of a millisecond.
+    """
+    if duration_sec <= 0:
+        return
+    end = time.perf_counter() + duration_sec
+    if duration_sec > _SPIN_TAIL_S:
+        _coarse_sleep(duration_sec - _SPIN_TAIL_S)
+    while time.perf_counter() < end:
+        pass
+
+
+def precise_sleep_interruptible(duration_sec, stop_event):
+    """
+    High-precision interruptible sleep that checks stop_event.
+    Returns True if interrupted, False if completed.
+
+    Blocks like precise_sleep() in slices of at most _STOP_POLL_S so a stop is
+    noticed promptly, then busy-waits the tail while still checking stop_event.
+    """
+    if duration_sec <= 0:
+        return False
+    end = time.perf_counter() + duration_sec
+    while True:
+        if stop_event.is_set():
+            return True
+        remaining = end - time.perf_counter() - _SPIN_TAIL_S
+        if remaining <= 0:
+            break
+        _coarse_sleep(min(remaining, _STOP_POLL_S))
+    while time.perf_counter() < end:
+        if stop_event.is_set():
+            return True
+    return False
+
+
+# ----------------------------
+# Image Helpers
+# ----------------------------
+
+def bgr_frame_to_image(frame_bgr: np.ndarray) -> Image.Image:
+    """
+    Convert a BGR frame (H,W,3 uint8) to an RGB PIL Image.
+
+    uint8 frames are read straight from their buffer with Pillow's BGR
+    unpacker, so the channel swap and copy happen in one pass. Crops are
+    packed first (a plain row copy, no per-pixel stride walk).
+    """
+    if frame_bgr.dtype == np.uint8 and frame_bgr.ndim == 3 and frame_bgr.shape[2] == 3:
+        buf = np.ascontiguousarray(frame_bgr)
+        h, w = buf.shape[:2]
+        return Image.frombuffer("RGB", (w, h), buf, "raw", "BGR", 0, 1)
+    return Image.fromarray(np.ascontiguousarray(frame_bgr[:, :, ::-1]))
+
+
+def mean_bgr_int(region_bgr: np.ndarray) -> tuple:
+    """
+    Average color of a BGR region as an (r, g, b) tuple of ints.
+
+    Sums in int64 and floor-divides by the pixel count, which equals the
+    truncated float mean (int(np.mean(...))) used before, without a float pass.
+    """
+    n_pixels = region_bgr.shape[0] * region_bgr.shape[1]
+    b, g, r = (region_bgr.sum(axis=(0, 1), dtype=np.int64) // n_pixels).tolist()
+    return (r, g, b)
+
+
 # ----------------------------
 # FFmpeg Download Support
 # ----------------------------